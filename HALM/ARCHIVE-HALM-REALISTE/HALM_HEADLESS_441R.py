@@ -1,6 +1,7 @@
 # HALM_IHM_HEADLESS_V6.py
 import random
 import math
+import hashlib
 import sys
 import time
 import json
@@ -24,10 +25,15 @@ HEURE = 60*60
 NOMBRE_SIMULATIONS_A_LANCER = 10
 PROCESSUS_PARALLELES_MAX = 4
 
-# Paramètres de la mission
+# Paramètres de la mission (en secondes simulées)
 TEMPS_MISSION_MAX_SECONDES =6*HEURE
 GENERER_IMAGES_ZONE = True
 
+# Mode accéléré : le temps est simulé (ticks de 1/FPS s) et la simulation
+# avance par grands pas tant que les drones sont en repos ou en ligne droite
+MODE_ACCELERE = True
+DEPLACEMENT_MAX_PAR_PAS = 1.0  # en pixels, pour ne rater ni zone ni détection
+
 # Paramètres par défaut pour chaque simulation
 NB_DRONES_SURFACE_DEFAUT = 5
 NB_DRONES_AERIEN_DEFAUT = 5
@@ -52,6 +58,22 @@ BLEU_CLAIR = (100, 100, 255)
 # SECTION 2: CLASSES DE LA SIMULATION
 # =============================================================================
 
+class SimulationClock:
+    """Horloge simulée : avance d'un pas fixe dt par tick, indépendamment du temps réel"""
+    def __init__(self, dt=1 / FPS):
+        self.dt = dt
+        self.ticks = 0
+
+    def avancer(self, nb_ticks=1):
+        self.ticks += nb_ticks
+
+    def maintenant(self):
+        return self.ticks * self.dt
+
+    def ticks_pour(self, duree):
+        """Nombre de ticks (au moins 1) nécessaires pour couvrir une durée simulée"""
+        return max(1, math.ceil(duree / self.dt - 1e-9))
+
 class Logger:
     def __init__(self, simulation_id):
         self.simulation_id = simulation_id
@@ -98,11 +120,13 @@ class Logger:
             print(f"[{self.simulation_id}] Erreur lors de la sauvegarde des logs: {e}")
 
 class Drone:
-    def __init__(self, x, y, spawn_x, spawn_y, type_creature="drone_de_surface", logger=None, creature_id=0):
+    def __init__(self, x, y, spawn_x, spawn_y, type_creature="drone_de_surface", logger=None, creature_id=0, horloge=None, rng=None):
         self.x, self.y = x, y
+        self.horloge = horloge if horloge is not None else SimulationClock()
+        self.rng = rng if rng is not None else random
         self.spawn_x, self.spawn_y = spawn_x, spawn_y
         self.type_creature, self.creature_id = type_creature, creature_id
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.angle = self.rng.uniform(0, 2 * math.pi)
         self.logger = logger
         
         self.communications_reçues = set()
@@ -114,7 +138,7 @@ class Drone:
         self.temps_repos_debut, self.retour_spawn, self.epuise = 0, False, False
         
         self.trajets_complets, self.temps_trajets = 0, []
-        self.temps_debut_trajet = time.time()
+        self.temps_debut_trajet = self.horloge.maintenant()
         self.distance_parcourue = 0
         self.zone_exploree = set()
         self.zones_decouvertes_uniques = set()
@@ -123,8 +147,8 @@ class Drone:
         self.temps_changement_direction = 0
         
         # --- NOUVEAU MECANISME POUR LIMITER LA FRÉQUENCE DES COMMUNICATIONS ---
-        self.last_comm_check_time = 0
-        self.comm_check_interval = 1.0 / FPS  # On ne vérifie que 60 fois par seconde
+        self.comm_check_interval_ticks = 1  # On ne vérifie qu'une fois par tick simulé
+        self.last_comm_check_tick = -self.comm_check_interval_ticks
         
         if type_creature == "drone_de_surface":
             self.vitesse = FACTEUR_ACCELERATION * 0.0138 / FPS
@@ -141,49 +165,73 @@ class Drone:
     def est_dans_zone_brouillage(self, brouillages):
         return any(b.x <= self.x < b.x + b.largeur and b.y <= self.y < b.y + b.hauteur for b in brouillages)
 
-    def communiquer_avec(self, autre, brouillages, simulation):
+    def communiquer_avec(self, autre, brouillages, simulation, nb_verifications=1):
+        """
+        Vérifications de communication avec autre sur les nb_verifications
+        derniers ticks (plusieurs d'un coup en mode accéléré). Les compteurs
+        sont ceux qu'auraient donnés autant d'appels tick par tick : une
+        tentative par vérification, un échec par vérification hors cooldown
+        en brouillage, une réussite à chaque fin de cooldown sinon.
+        """
         # --- CORRECTION: Logique de comptage alignée sur HALM_IHM44.py ---
         # La tentative est comptée même si le drone est en cooldown.
-        self.tentatives_communication += 1
-        
-        if autre.creature_id in self.derniere_communication and time.time() - self.derniere_communication[autre.creature_id] < self.cooldown_communication:
+        self.tentatives_communication += nb_verifications
+
+        maintenant = self.horloge.ticks
+        premiere = maintenant - (nb_verifications - 1) * self.comm_check_interval_ticks
+        cooldown = self.horloge.ticks_pour(self.cooldown_communication)
+        derniere = self.derniere_communication.get(autre.creature_id)
+        if derniere is not None:
+            # Première vérification tombant après la fin du cooldown
+            fin_cooldown = round(derniere / self.horloge.dt) + cooldown
+            if fin_cooldown > premiere:
+                premiere += -(-(fin_cooldown - premiere) // self.comm_check_interval_ticks) * self.comm_check_interval_ticks
+        if premiere > maintenant:
             return False
+        hors_cooldown = (maintenant - premiere) // self.comm_check_interval_ticks + 1
         
         if self.est_dans_zone_brouillage(brouillages) or autre.est_dans_zone_brouillage(brouillages):
-            self.communications_echouees += 1
+            self.communications_echouees += hors_cooldown
             return False
         
+        # Une réussite, puis une nouvelle à la première vérification après chaque cooldown
+        ecart = -(-cooldown // self.comm_check_interval_ticks) * self.comm_check_interval_ticks
+        nb_reussies = (maintenant - premiere) // ecart + 1
+        derniere_reussite = (premiere + (nb_reussies - 1) * ecart) * self.horloge.dt
+
         self.communications_reçues.add(autre.creature_id)
         autre.communications_reçues.add(self.creature_id)
-        self.communications_envoyees += 1
-        autre.communications_envoyees += 1
+        self.communications_envoyees += nb_reussies
+        autre.communications_envoyees += nb_reussies
         
-        now = time.time()
-        self.derniere_communication[autre.creature_id] = now
-        autre.derniere_communication[self.creature_id] = now
+        self.derniere_communication[autre.creature_id] = derniere_reussite
+        autre.derniere_communication[self.creature_id] = derniere_reussite
         
         t1, t2 = self.type_creature, autre.type_creature
-        if t1 == "drone_de_surface" and t2 == "drone_de_surface": simulation.comms_surface_surface += 1
-        elif t1 == "drone_aerien" and t2 == "drone_aerien": simulation.comms_aerien_aerien += 1
-        else: simulation.comms_surface_aerien += 1
+        if t1 == "drone_de_surface" and t2 == "drone_de_surface": simulation.comms_surface_surface += nb_reussies
+        elif t1 == "drone_aerien" and t2 == "drone_aerien": simulation.comms_aerien_aerien += nb_reussies
+        else: simulation.comms_surface_aerien += nb_reussies
         return True
     
-    def verifier_communications(self, autres, brouillages, simulation):
+    def verifier_communications(self, autres, brouillages, simulation, nb_verifications=1):
         for autre in autres:
             if autre.creature_id != self.creature_id and not autre.epuise and not self.epuise:
                 dist = math.hypot(self.x - autre.x, self.y - autre.y)
                 if dist <= (self.rayon_communication + autre.rayon_communication) / 2:
-                    self.communiquer_avec(autre, brouillages, simulation)
+                    self.communiquer_avec(autre, brouillages, simulation, nb_verifications)
     
-    def deplacer(self, obstacles, homme_a_la_mer, autres, brouillages, simulation):
+    def deplacer(self, obstacles, homme_a_la_mer, autres, brouillages, simulation, nb_ticks=1):
+        """Fait avancer le drone de nb_ticks pas de temps (plusieurs en mode accéléré)"""
         if self.epuise: return
-        self.temps_depuis_spawn += 1/FPS
+        self.temps_depuis_spawn += nb_ticks * self.horloge.dt
 
         # --- NOUVEAU: Appel à la vérification de communication limité dans le temps ---
-        current_time = time.time()
-        if not self.en_repos and (current_time - self.last_comm_check_time > self.comm_check_interval):
-            self.verifier_communications(autres, brouillages, simulation)
-            self.last_comm_check_time = current_time
+        current_tick = self.horloge.ticks
+        if not self.en_repos and (current_tick - self.last_comm_check_tick >= self.comm_check_interval_ticks):
+            # Un pas accéléré couvre autant de vérifications que de ticks tombés sur l'intervalle
+            nb_verifications = max(1, min(nb_ticks, current_tick - self.last_comm_check_tick) // self.comm_check_interval_ticks)
+            self.verifier_communications(autres, brouillages, simulation, nb_verifications)
+            self.last_comm_check_tick = current_tick
         
         if not self.en_repos and not self.retour_spawn and self.temps_depuis_spawn >= self.temps_avant_repos:
             self.retour_spawn = True
@@ -195,26 +243,27 @@ class Drone:
                 return
             if dist_spawn < 5:
                 self.en_repos, self.retour_spawn = True, False
-                self.temps_repos_debut = time.time()
+                self.temps_repos_debut = self.horloge.maintenant()
                 self.x, self.y = self.spawn_x, self.spawn_y
-                if self.temps_debut_trajet:
-                    self.temps_trajets.append(time.time() - self.temps_debut_trajet)
+                if self.temps_debut_trajet is not None:
+                    self.temps_trajets.append(self.horloge.maintenant() - self.temps_debut_trajet)
                     self.trajets_complets += 1
                 return
             else:
                 self.angle = math.atan2(self.spawn_y - self.y, self.spawn_x - self.x)
         
         elif self.en_repos:
-            if time.time() - self.temps_repos_debut >= self.duree_repos:
+            if self.horloge.maintenant() - self.temps_repos_debut >= self.duree_repos:
                 self.en_repos = False
-                self.temps_depuis_spawn, self.temps_debut_trajet = 0, time.time()
+                self.temps_depuis_spawn, self.temps_debut_trajet = 0, self.horloge.maintenant()
+                nb_ticks = 1  # les ticks précédents ont été passés au repos
             else:
                 return
         
         else: # Exploration
-            self.temps_changement_direction += 1
+            self.temps_changement_direction += nb_ticks
             if self.temps_changement_direction > 60:
-                self.angle += random.uniform(-0.5, 0.5)
+                self.angle += self.rng.uniform(-0.5, 0.5)
                 self.temps_changement_direction = 0
             if self.type_creature == "drone_de_surface":
                 for o in obstacles:
@@ -223,7 +272,8 @@ class Drone:
             if self.a_trouve_homme_mer:
                 self.angle = math.atan2(homme_a_la_mer.y - self.y, homme_a_la_mer.x - self.x)
         
-        nx, ny = self.x + math.cos(self.angle) * self.vitesse, self.y + math.sin(self.angle) * self.vitesse
+        pas = self.vitesse * nb_ticks
+        nx, ny = self.x + math.cos(self.angle) * pas, self.y + math.sin(self.angle) * pas
         
         ok = 0 <= nx < LARGEUR_SIMULATION and 0 <= ny < HAUTEUR_SIMULATION
         if ok and self.type_creature == "drone_de_surface":
@@ -238,13 +288,39 @@ class Drone:
         
         if not self.epuise and not self.en_repos:
             if not self.a_trouve_homme_mer and math.hypot(self.x - homme_a_la_mer.x, self.y - homme_a_la_mer.y) < self.zone_decouverte:
-                self.a_trouve_homme_mer, self.temps_premiere_decouverte_homme_mer = True, time.time()
+                self.a_trouve_homme_mer, self.temps_premiere_decouverte_homme_mer = True, self.horloge.maintenant()
             
             r_exp = self.zone_decouverte // 10
             for dx in range(-r_exp, r_exp + 1):
                 for dy in range(-r_exp, r_exp + 1):
                     if dx*dx + dy*dy <= r_exp*r_exp:
-                        self.zone_exploree.add((int((self.x + dx*10)//10), int((self.y + dy*10)//10)))
+                        zone = (int((self.x + dx*10)//10), int((self.y + dy*10)//10))
+                        if zone not in self.zone_exploree:
+                            # Couverture globale tenue à jour au fil de l'eau
+                            self.zone_exploree.add(zone)
+                            simulation.zones_explorees.add(zone)
+
+    def ticks_avant_evenement(self):
+        """
+        Nombre de ticks pendant lesquels le drone peut avancer d'un seul pas
+        sans franchir de changement d'état, de direction ou de distance maximale.
+        """
+        if self.epuise:
+            return None
+        if self.en_repos:
+            return self.horloge.ticks_pour(self.duree_repos - (self.horloge.maintenant() - self.temps_repos_debut))
+
+        pas_max = max(1, int(DEPLACEMENT_MAX_PAR_PAS / self.vitesse)) if self.vitesse > 0 else None
+        if self.retour_spawn:
+            # Trajet rectiligne vers le spawn : seul l'épuisement peut l'interrompre
+            echeance = self.temps_avant_repos + 5
+        else:
+            echeance = self.temps_avant_repos
+            if not self.a_trouve_homme_mer:
+                ticks_direction = max(1, 61 - self.temps_changement_direction)
+                pas_max = ticks_direction if pas_max is None else min(pas_max, ticks_direction)
+        ticks_echeance = self.horloge.ticks_pour(echeance - self.temps_depuis_spawn)
+        return ticks_echeance if pas_max is None else min(pas_max, ticks_echeance)
 
 class Obstacle:
     def __init__(self, x, y, largeur, hauteur): self.x, self.y, self.largeur, self.hauteur = x, y, largeur, hauteur
@@ -254,7 +330,7 @@ class HommeALaMer:
     def __init__(self, x, y): self.x, self.y = x, y
 
 class Simulation:
-    def __init__(self, simulation_id, config, image_dir=None, stats_dir=None):
+    def __init__(self, simulation_id, config, image_dir=None, stats_dir=None, seed=None):
         self.simulation_id = simulation_id
         self.image_dir = image_dir
         self.stats_dir = stats_dir
@@ -267,11 +343,17 @@ class Simulation:
         self.pourcentage_obstacle_reel, self.pourcentage_brouillage_reel = 0, 0
 
         self.logger = Logger(simulation_id)
+        self.horloge = SimulationClock()
+        # Graine explicite : un générateur pour le monde, un autre pour les drones
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+        self.rng_monde = random.Random(self.seed)
+        self.rng = random.Random(f"{self.seed}:drones")
+        self.hash_scenario = None
         self.creatures, self.obstacles, self.brouillages = [], [], []
         self.homme_a_la_mer = None
         self.zones_explorees = set()
         self.homme_a_la_mer_decouvert = False
-        self.temps_debut, self.temps_fin = time.time(), None
+        self.temps_debut, self.temps_fin = self.horloge.maintenant(), None
         self.simulation_reussie = False
         self.raison_echec = "N/A"
         self.premiere_decouverte_homme_mer, self.qui_a_trouve_homme_mer = None, None
@@ -285,38 +367,52 @@ class Simulation:
         cid = self.next_creature_id; self.next_creature_id += 1; return cid
     
     def generer_monde(self):
-        for _ in range(self.nb_drones_surface): self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, "drone_de_surface", self.logger, self.get_next_creature_id()))
-        for _ in range(self.nb_drones_aerien): self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, "drone_aerien", self.logger, self.get_next_creature_id()))
+        for _ in range(self.nb_drones_surface): self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, "drone_de_surface", self.logger, self.get_next_creature_id(), self.horloge, self.rng))
+        for _ in range(self.nb_drones_aerien): self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, "drone_aerien", self.logger, self.get_next_creature_id(), self.horloge, self.rng))
         
         surface_totale = LARGEUR_SIMULATION * HAUTEUR_SIMULATION
         
-        obs_p = random.uniform(self.min_obstacle_percent, self.max_obstacle_percent)
+        obs_p = self.rng_monde.uniform(self.min_obstacle_percent, self.max_obstacle_percent)
         s_obs_cible = surface_totale * (obs_p / 100.0)
         s_obs_act = 0
         while s_obs_act < s_obs_cible:
-            l, h = random.randint(20, 80), random.randint(20, 80)
-            x, y = random.randint(0, LARGEUR_SIMULATION - l), random.randint(0, HAUTEUR_SIMULATION - h)
+            l, h = self.rng_monde.randint(20, 80), self.rng_monde.randint(20, 80)
+            x, y = self.rng_monde.randint(0, LARGEUR_SIMULATION - l), self.rng_monde.randint(0, HAUTEUR_SIMULATION - h)
             self.obstacles.append(Obstacle(x, y, l, h)); s_obs_act += l * h
         self.pourcentage_obstacle_reel = (s_obs_act / surface_totale) * 100
         
-        bro_p = random.uniform(self.min_brouillage_percent, self.max_brouillage_percent)
+        bro_p = self.rng_monde.uniform(self.min_brouillage_percent, self.max_brouillage_percent)
         s_bro_cible = surface_totale * (bro_p / 100.0)
         s_bro_act = 0
         while s_bro_act < s_bro_cible:
-            l, h = random.randint(40, 120), random.randint(40, 120)
-            x, y = random.randint(0, LARGEUR_SIMULATION - l), random.randint(0, HAUTEUR_SIMULATION - h)
+            l, h = self.rng_monde.randint(40, 120), self.rng_monde.randint(40, 120)
+            x, y = self.rng_monde.randint(0, LARGEUR_SIMULATION - l), self.rng_monde.randint(0, HAUTEUR_SIMULATION - h)
             self.brouillages.append(Brouillage(x, y, l, h)); s_bro_act += l * h
         self.pourcentage_brouillage_reel = (s_bro_act / surface_totale) * 100
         
-        zx, zy = random.randint(0, 2), random.randint(0, 2)
+        zx, zy = self.rng_monde.randint(0, 2), self.rng_monde.randint(0, 2)
         zl, zh = LARGEUR_SIMULATION / 3, HAUTEUR_SIMULATION / 3
         while True:
-            hx, hy = random.randint(int(zx*zl), int((zx+1)*zl)), random.randint(int(zy*zh), int((zy+1)*zh))
+            hx, hy = self.rng_monde.randint(int(zx*zl), int((zx+1)*zl)), self.rng_monde.randint(int(zy*zh), int((zy+1)*zh))
             if not any(o.x <= hx < o.x + o.largeur and o.y <= hy < o.y + o.hauteur for o in self.obstacles):
                 self.homme_a_la_mer = HommeALaMer(hx, hy); break
+
+        self.hash_scenario = self.calculer_hash_scenario()
+        self.logger.log_event("world_generated", {"seed": self.seed, "scenario_hash": self.hash_scenario})
         
         if self.image_dir: self.generer_image_zone()
 
+    def calculer_hash_scenario(self):
+        """Empreinte SHA-256 stable du monde généré, pour comparer ou rejouer un scénario"""
+        contenu = {
+            "taille": [LARGEUR_SIMULATION, HAUTEUR_SIMULATION],
+            "spawn": [self.spawn_x, self.spawn_y],
+            "obstacles": [[o.x, o.y, o.largeur, o.hauteur] for o in self.obstacles],
+            "brouillages": [[b.x, b.y, b.largeur, b.hauteur] for b in self.brouillages],
+            "homme_a_la_mer": [self.homme_a_la_mer.x, self.homme_a_la_mer.y],
+        }
+        return hashlib.sha256(json.dumps(contenu, sort_keys=True).encode("utf-8")).hexdigest()
+
     def generer_image_zone(self):
         try:
             img = Image.new('RGB', (LARGEUR_SIMULATION, HAUTEUR_SIMULATION), 'white')
@@ -329,18 +425,34 @@ class Simulation:
         except Exception as e:
             print(f"[{self.simulation_id}] Erreur image: {e}")
 
+    def calculer_pas(self):
+        """
+        Nombre de ticks simulés à parcourir d'un coup : le plus grand pas qui ne
+        saute aucun évènement (fin de repos, retour, changement de direction,
+        fin de mission) et ne déplace aucun drone de plus de DEPLACEMENT_MAX_PAR_PAS.
+        """
+        ticks_restants = self.horloge.ticks_pour(TEMPS_MISSION_MAX_SECONDES - (self.horloge.maintenant() - self.temps_debut))
+        pas = [ticks_restants]
+        for c in self.creatures:
+            t = c.ticks_avant_evenement()
+            if t is not None:
+                pas.append(t)
+        return min(pas)
+
     def mettre_a_jour(self):
         if self.pause_automatique: return
         
-        if time.time() - self.temps_debut > TEMPS_MISSION_MAX_SECONDES:
+        if self.horloge.maintenant() - self.temps_debut > TEMPS_MISSION_MAX_SECONDES:
             self.pause_automatique, self.simulation_reussie, self.raison_echec = True, False, "Temps écoulé"
             return
         if not self.homme_a_la_mer_decouvert and all(c.epuise for c in self.creatures):
             self.pause_automatique, self.simulation_reussie, self.raison_echec = True, False, "Épuisement des drones"
             return
             
+        nb_ticks = self.calculer_pas() if MODE_ACCELERE else 1
+        self.horloge.avancer(nb_ticks)
         for c in self.creatures:
-            c.deplacer(self.obstacles, self.homme_a_la_mer, self.creatures, self.brouillages, self)
+            c.deplacer(self.obstacles, self.homme_a_la_mer, self.creatures, self.brouillages, self, nb_ticks)
             if c.a_trouve_homme_mer and not self.homme_a_la_mer_decouvert:
                 self.homme_a_la_mer_decouvert = True
                 self.simulation_reussie = True
@@ -348,11 +460,10 @@ class Simulation:
                 self.qui_a_trouve_homme_mer = f"{c.type_creature}_{c.creature_id}"
                 self.pause_automatique = True
                 break
-        
-        self.zones_explorees.update(*(c.zone_exploree for c in self.creatures))
+
     
     def sauvegarder_statistiques(self):
-        self.temps_fin = time.time()
+        self.temps_fin = self.horloge.maintenant()
         duree = self.temps_fin - self.temps_debut
         
         stats_surface = self._calculer_stats_type("drone_de_surface")
@@ -364,16 +475,18 @@ class Simulation:
         drones_communicants = sum(1 for c in self.creatures if len(c.communications_reçues) > 0)
         creatures_epuisees = sum(1 for c in self.creatures if c.epuise)
         
-        temps_decouverte = self.premiere_decouverte_homme_mer - self.temps_debut if self.premiere_decouverte_homme_mer else None
+        temps_decouverte = self.premiere_decouverte_homme_mer - self.temps_debut if self.premiere_decouverte_homme_mer is not None else None
         
         statistiques = {
             "timestamp": datetime.now().isoformat(),
             "duree_simulation_secondes": round(duree, 2),
             "simulation_reussie": self.simulation_reussie,
-            "temps_decouverte_homme_mer": round(temps_decouverte, 2) if temps_decouverte else None,
+            "raison_echec": None if self.simulation_reussie else self.raison_echec,
+            "temps_decouverte_homme_mer": round(temps_decouverte, 2) if temps_decouverte is not None else None,
             "qui_a_trouve_homme_mer": self.qui_a_trouve_homme_mer,
             
             "configuration": {
+                "seed": self.seed, "hash_scenario": self.hash_scenario,
                 "nombre_drones_surface": self.nb_drones_surface, "nombre_drones_aerien": self.nb_drones_aerien,
                 "spawn_position": [self.spawn_x, self.spawn_y],
                 "homme_a_la_mer_position": [self.homme_a_la_mer.x, self.homme_a_la_mer.y],
@@ -471,7 +584,7 @@ class Simulation:
 # SECTION 3: FONCTION D'EXÉCUTION
 # =============================================================================
 
-def run_single_simulation(simulation_id, image_dir=None, stats_dir=None):
+def run_single_simulation(simulation_id, image_dir=None, stats_dir=None, seed=None):
     print(f"[Sim-{simulation_id}] Lancement...")
     start_time = time.time()
     
@@ -482,7 +595,7 @@ def run_single_simulation(simulation_id, image_dir=None, stats_dir=None):
         'min_brouillage_percent': MIN_BROUILLAGE_PERCENT, 'max_brouillage_percent': MAX_BROUILLAGE_PERCENT,
     }
     
-    sim = Simulation(f"Sim-{simulation_id}", config, image_dir, stats_dir)
+    sim = Simulation(f"Sim-{simulation_id}", config, image_dir, stats_dir, seed)
     while not sim.pause_automatique:
         sim.mettre_a_jour()
 
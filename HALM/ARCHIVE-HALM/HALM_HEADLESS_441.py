@@ -1,12 +1,16 @@
 # HALM_IHM_HEADLESS_V6.py
 import random
 import math
+import hashlib
 import sys
 import time
 import json
 import os
 from datetime import datetime
+from collections import namedtuple
 import concurrent.futures
+import io
+import numpy as np
 from PIL import Image, ImageDraw
 
 # =============================================================================
@@ -24,9 +28,21 @@ NOMBRE_SIMULATIONS_A_LANCER = 10
 PROCESSUS_PARALLELES_MAX = 4
 
 # Paramètres de la mission
-TEMPS_MISSION_MAX_SECONDES = 60.0
+# Durée maximale d'une mission en secondes simulées (ticks * 1 / FPS), et non
+# plus en secondes réelles : le résultat ne dépend plus de la charge de la
+# machine. L'ancienne limite de 60 s réelles laissait tourner des millions de
+# ticks, donc en pratique jusqu'à la découverte ou l'épuisement ; une heure
+# simulée (216 000 ticks) joue le même rôle de garde-fou pour les flottes qui
+# alternent indéfiniment exploration et repos.
+TEMPS_MISSION_MAX_SECONDES = 3600.0
 GENERER_IMAGES_ZONE = True
 
+# Cache disque des mondes générés (obstacles, brouillage, grilles, aperçu)
+UTILISER_CACHE_MONDES = True
+CACHE_MONDES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache_mondes") # À côté du script, quel que soit le dossier de lancement
+VERSION_CACHE_MONDES = 1 # À incrémenter si la génération du monde change
+TAILLE_MEMOIRE_MONDES = 16 # Mondes gardés en mémoire par processus (environ 2 Mo chacun)
+
 # Paramètres par défaut pour chaque simulation
 NB_DRONES_SURFACE_DEFAUT = 5
 NB_DRONES_AERIEN_DEFAUT = 5
@@ -51,6 +67,18 @@ BLEU_CLAIR = (100, 100, 255)
 # SECTION 2: CLASSES DE LA SIMULATION
 # =============================================================================
 
+class SimulationClock:
+    """Horloge simulée : avance d'un pas fixe dt par tick, indépendamment du temps réel"""
+    def __init__(self, dt=1 / FPS):
+        self.dt = dt
+        self.ticks = 0
+
+    def avancer(self, nb_ticks=1):
+        self.ticks += nb_ticks
+
+    def maintenant(self):
+        return self.ticks * self.dt
+
 class Logger:
     def __init__(self, simulation_id):
         self.simulation_id = simulation_id
@@ -96,12 +124,25 @@ class Logger:
         except Exception as e:
             print(f"[{self.simulation_id}] Erreur lors de la sauvegarde des logs: {e}")
 
+_DECALAGES_DISQUE = {}
+_MONDES_EN_MEMOIRE = {} # Clé de génération -> monde déjà chargé ou construit dans ce processus
+
+def decalages_disque(rayon):
+    """Décalages (dx, dy) du disque d'exploration, précalculés une fois par rayon et par processus"""
+    decalages = _DECALAGES_DISQUE.get(rayon)
+    if decalages is None:
+        decalages = tuple((dx, dy) for dx in range(-rayon, rayon + 1) for dy in range(-rayon, rayon + 1) if dx*dx + dy*dy <= rayon*rayon)
+        _DECALAGES_DISQUE[rayon] = decalages
+    return decalages
+
 class Drone:
-    def __init__(self, x, y, spawn_x, spawn_y, type_creature="drone_de_surface", logger=None, creature_id=0):
+    def __init__(self, x, y, spawn_x, spawn_y, type_creature="drone_de_surface", logger=None, creature_id=0, horloge=None, rng=None):
         self.x, self.y = x, y
+        self.horloge = horloge if horloge is not None else SimulationClock()
+        self.rng = rng if rng is not None else random
         self.spawn_x, self.spawn_y = spawn_x, spawn_y
         self.type_creature, self.creature_id = type_creature, creature_id
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.angle = self.rng.uniform(0, 2 * math.pi)
         self.logger = logger
         
         self.communications_reçues = set()
@@ -113,7 +154,7 @@ class Drone:
         self.temps_repos_debut, self.retour_spawn, self.epuise = 0, False, False
         
         self.trajets_complets, self.temps_trajets = 0, []
-        self.temps_debut_trajet = time.time()
+        self.temps_debut_trajet = self.horloge.maintenant()
         self.distance_parcourue = 0
         self.zone_exploree = set()
         self.zones_decouvertes_uniques = set()
@@ -122,8 +163,8 @@ class Drone:
         self.temps_changement_direction = 0
         
         # --- NOUVEAU MECANISME POUR LIMITER LA FRÉQUENCE DES COMMUNICATIONS ---
-        self.last_comm_check_time = 0
-        self.comm_check_interval = 1.0 / FPS  # On ne vérifie que 60 fois par seconde
+        self.comm_check_interval_ticks = 1  # On ne vérifie qu'une fois par tick simulé
+        self.last_comm_check_tick = -self.comm_check_interval_ticks
         
         if type_creature == "drone_de_surface":
             self.vitesse = FACTEUR_ACCELERATION * 13.8 / FPS
@@ -145,10 +186,11 @@ class Drone:
         # La tentative est comptée même si le drone est en cooldown.
         self.tentatives_communication += 1
         
-        if autre.creature_id in self.derniere_communication and time.time() - self.derniere_communication[autre.creature_id] < self.cooldown_communication:
+        now = self.horloge.maintenant()
+        if autre.creature_id in self.derniere_communication and now - self.derniere_communication[autre.creature_id] < self.cooldown_communication:
             return False
         
-        if self.est_dans_zone_brouillage(brouillages) or autre.est_dans_zone_brouillage(brouillages):
+        if simulation.point_dans_brouillage(self.x, self.y) or simulation.point_dans_brouillage(autre.x, autre.y):
             self.communications_echouees += 1
             return False
         
@@ -157,7 +199,6 @@ class Drone:
         self.communications_envoyees += 1
         autre.communications_envoyees += 1
         
-        now = time.time()
         self.derniere_communication[autre.creature_id] = now
         autre.derniere_communication[self.creature_id] = now
         
@@ -176,13 +217,13 @@ class Drone:
     
     def deplacer(self, obstacles, homme_a_la_mer, autres, brouillages, simulation):
         if self.epuise: return
-        self.temps_depuis_spawn += 1/FPS
+        self.temps_depuis_spawn += self.horloge.dt
 
         # --- NOUVEAU: Appel à la vérification de communication limité dans le temps ---
-        current_time = time.time()
-        if not self.en_repos and (current_time - self.last_comm_check_time > self.comm_check_interval):
+        current_tick = self.horloge.ticks
+        if not self.en_repos and (current_tick - self.last_comm_check_tick >= self.comm_check_interval_ticks):
             self.verifier_communications(autres, brouillages, simulation)
-            self.last_comm_check_time = current_time
+            self.last_comm_check_tick = current_tick
         
         if not self.en_repos and not self.retour_spawn and self.temps_depuis_spawn >= self.temps_avant_repos:
             self.retour_spawn = True
@@ -194,28 +235,28 @@ class Drone:
                 return
             if dist_spawn < 5:
                 self.en_repos, self.retour_spawn = True, False
-                self.temps_repos_debut = time.time()
+                self.temps_repos_debut = self.horloge.maintenant()
                 self.x, self.y = self.spawn_x, self.spawn_y
-                if self.temps_debut_trajet:
-                    self.temps_trajets.append(time.time() - self.temps_debut_trajet)
+                if self.temps_debut_trajet is not None:
+                    self.temps_trajets.append(self.horloge.maintenant() - self.temps_debut_trajet)
                     self.trajets_complets += 1
                 return
             else:
                 self.angle = math.atan2(self.spawn_y - self.y, self.spawn_x - self.x)
         
         elif self.en_repos:
-            if time.time() - self.temps_repos_debut >= self.duree_repos:
+            if self.horloge.maintenant() - self.temps_repos_debut >= self.duree_repos:
                 self.en_repos = False
-                self.temps_depuis_spawn, self.temps_debut_trajet = 0, time.time()
+                self.temps_depuis_spawn, self.temps_debut_trajet = 0, self.horloge.maintenant()
             else:
                 return
         
         else: # Exploration
             self.temps_changement_direction += 1
             if self.temps_changement_direction > 60:
-                self.angle += random.uniform(-0.5, 0.5)
+                self.angle += self.rng.uniform(-0.5, 0.5)
                 self.temps_changement_direction = 0
-            if self.type_creature == "drone_de_surface":
+            if self.type_creature == "drone_de_surface" and simulation.point_dans_obstacle(self.x, self.y):
                 for o in obstacles:
                     if o.x <= self.x < o.x + o.largeur and o.y <= self.y < o.y + o.hauteur:
                         self.angle = math.atan2(self.y - (o.y + o.hauteur/2), self.x - (o.x + o.largeur/2))
@@ -226,7 +267,7 @@ class Drone:
         
         ok = 0 <= nx < LARGEUR_SIMULATION and 0 <= ny < HAUTEUR_SIMULATION
         if ok and self.type_creature == "drone_de_surface":
-            if any(o.x <= nx < o.x + o.largeur and o.y <= ny < o.y + o.hauteur for o in obstacles):
+            if simulation.point_dans_obstacle(nx, ny):
                 ok = False
         
         if ok:
@@ -237,13 +278,14 @@ class Drone:
         
         if not self.epuise and not self.en_repos:
             if not self.a_trouve_homme_mer and math.hypot(self.x - homme_a_la_mer.x, self.y - homme_a_la_mer.y) < self.zone_decouverte:
-                self.a_trouve_homme_mer, self.temps_premiere_decouverte_homme_mer = True, time.time()
+                self.a_trouve_homme_mer, self.temps_premiere_decouverte_homme_mer = True, self.horloge.maintenant()
             
-            r_exp = self.zone_decouverte // 10
-            for dx in range(-r_exp, r_exp + 1):
-                for dy in range(-r_exp, r_exp + 1):
-                    if dx*dx + dy*dy <= r_exp*r_exp:
-                        self.zone_exploree.add((int((self.x + dx*10)//10), int((self.y + dy*10)//10)))
+            for dx, dy in decalages_disque(self.zone_decouverte // 10):
+                zone = (int((self.x + dx*10)//10), int((self.y + dy*10)//10))
+                if zone not in self.zone_exploree:
+                    # Couverture globale tenue à jour au fil de l'eau
+                    self.zone_exploree.add(zone)
+                    simulation.zones_explorees.add(zone)
 
 class Obstacle:
     def __init__(self, x, y, largeur, hauteur): self.x, self.y, self.largeur, self.hauteur = x, y, largeur, hauteur
@@ -253,7 +295,7 @@ class HommeALaMer:
     def __init__(self, x, y): self.x, self.y = x, y
 
 class Simulation:
-    def __init__(self, simulation_id, config, image_dir=None, stats_dir=None):
+    def __init__(self, simulation_id, config, image_dir=None, stats_dir=None, seed=None):
         self.simulation_id = simulation_id
         self.image_dir = image_dir
         self.stats_dir = stats_dir
@@ -266,11 +308,17 @@ class Simulation:
         self.pourcentage_obstacle_reel, self.pourcentage_brouillage_reel = 0, 0
 
         self.logger = Logger(simulation_id)
+        self.horloge = SimulationClock()
+        # Graine explicite : un générateur pour le monde, un autre pour les drones
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+        self.rng_monde = random.Random(self.seed)
+        self.rng = random.Random(f"{self.seed}:drones")
+        self.hash_scenario = None
         self.creatures, self.obstacles, self.brouillages = [], [], []
         self.homme_a_la_mer = None
         self.zones_explorees = set()
         self.homme_a_la_mer_decouvert = False
-        self.temps_debut, self.temps_fin = time.time(), None
+        self.temps_debut, self.temps_fin = self.horloge.maintenant(), None
         self.simulation_reussie = False
         self.raison_echec = "N/A"
         self.premiere_decouverte_homme_mer, self.qui_a_trouve_homme_mer = None, None
@@ -284,39 +332,163 @@ class Simulation:
         cid = self.next_creature_id; self.next_creature_id += 1; return cid
     
     def generer_monde(self):
-        for _ in range(self.nb_drones_surface): self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, "drone_de_surface", self.logger, self.get_next_creature_id()))
-        for _ in range(self.nb_drones_aerien): self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, "drone_aerien", self.logger, self.get_next_creature_id()))
+        for _ in range(self.nb_drones_surface): self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, "drone_de_surface", self.logger, self.get_next_creature_id(), self.horloge, self.rng))
+        for _ in range(self.nb_drones_aerien): self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, "drone_aerien", self.logger, self.get_next_creature_id(), self.horloge, self.rng))
+        
+        self.image_zone = None
+        cle = self.cle_monde()
+        monde = _MONDES_EN_MEMOIRE.get(cle) if UTILISER_CACHE_MONDES else None
+        if monde is not None:
+            self.reprendre_monde(monde)
+        else:
+            if not (UTILISER_CACHE_MONDES and self.charger_monde()):
+                self.construire_monde()
+                if UTILISER_CACHE_MONDES:
+                    self.sauvegarder_monde()
+            self.hash_scenario = self.calculer_hash_scenario()
+
+        self.logger.log_event("world_generated", {"seed": self.seed, "scenario_hash": self.hash_scenario})
         
+        if self.image_dir: self.generer_image_zone()
+        if UTILISER_CACHE_MONDES: self.memoriser_monde(cle)
+
+    def construire_monde(self):
+        """Tire obstacles, brouillage et homme à la mer, puis rasterise les grilles de test"""
         surface_totale = LARGEUR_SIMULATION * HAUTEUR_SIMULATION
         
-        obs_p = random.uniform(self.min_obstacle_percent, self.max_obstacle_percent)
+        obs_p = self.rng_monde.uniform(self.min_obstacle_percent, self.max_obstacle_percent)
         s_obs_cible = surface_totale * (obs_p / 100.0)
         s_obs_act = 0
         while s_obs_act < s_obs_cible:
-            l, h = random.randint(20, 80), random.randint(20, 80)
-            x, y = random.randint(0, LARGEUR_SIMULATION - l), random.randint(0, HAUTEUR_SIMULATION - h)
+            l, h = self.rng_monde.randint(20, 80), self.rng_monde.randint(20, 80)
+            x, y = self.rng_monde.randint(0, LARGEUR_SIMULATION - l), self.rng_monde.randint(0, HAUTEUR_SIMULATION - h)
             self.obstacles.append(Obstacle(x, y, l, h)); s_obs_act += l * h
         self.pourcentage_obstacle_reel = (s_obs_act / surface_totale) * 100
         
-        bro_p = random.uniform(self.min_brouillage_percent, self.max_brouillage_percent)
+        bro_p = self.rng_monde.uniform(self.min_brouillage_percent, self.max_brouillage_percent)
         s_bro_cible = surface_totale * (bro_p / 100.0)
         s_bro_act = 0
         while s_bro_act < s_bro_cible:
-            l, h = random.randint(40, 120), random.randint(40, 120)
-            x, y = random.randint(0, LARGEUR_SIMULATION - l), random.randint(0, HAUTEUR_SIMULATION - h)
+            l, h = self.rng_monde.randint(40, 120), self.rng_monde.randint(40, 120)
+            x, y = self.rng_monde.randint(0, LARGEUR_SIMULATION - l), self.rng_monde.randint(0, HAUTEUR_SIMULATION - h)
             self.brouillages.append(Brouillage(x, y, l, h)); s_bro_act += l * h
         self.pourcentage_brouillage_reel = (s_bro_act / surface_totale) * 100
         
-        zx, zy = random.randint(0, 2), random.randint(0, 2)
+        self.construire_grilles()
+        zx, zy = self.rng_monde.randint(0, 2), self.rng_monde.randint(0, 2)
         zl, zh = LARGEUR_SIMULATION / 3, HAUTEUR_SIMULATION / 3
         while True:
-            hx, hy = random.randint(int(zx*zl), int((zx+1)*zl)), random.randint(int(zy*zh), int((zy+1)*zh))
-            if not any(o.x <= hx < o.x + o.largeur and o.y <= hy < o.y + o.hauteur for o in self.obstacles):
+            hx, hy = self.rng_monde.randint(int(zx*zl), int((zx+1)*zl)), self.rng_monde.randint(int(zy*zh), int((zy+1)*zh))
+            if not self.point_dans_obstacle(hx, hy):
                 self.homme_a_la_mer = HommeALaMer(hx, hy); break
-        
-        if self.image_dir: self.generer_image_zone()
 
-    def generer_image_zone(self):
+    def construire_grilles(self):
+        """
+        Grilles au pixel (une case par pixel, ligne par ligne) des obstacles et
+        du brouillage : un test de point devient une simple lecture, exacte
+        puisque les rectangles ont des coordonnées entières.
+        """
+        self.grille_obstacles_np = np.zeros((HAUTEUR_SIMULATION, LARGEUR_SIMULATION), dtype=bool)
+        for o in self.obstacles: self.grille_obstacles_np[o.y:o.y + o.hauteur, o.x:o.x + o.largeur] = True
+        self.grille_brouillage_np = np.zeros((HAUTEUR_SIMULATION, LARGEUR_SIMULATION), dtype=bool)
+        for b in self.brouillages: self.grille_brouillage_np[b.y:b.y + b.hauteur, b.x:b.x + b.largeur] = True
+        self.grille_obstacles = self.grille_obstacles_np.tobytes()
+        self.grille_brouillage = self.grille_brouillage_np.tobytes()
+
+    def point_dans_obstacle(self, x, y):
+        return 0 <= x < LARGEUR_SIMULATION and 0 <= y < HAUTEUR_SIMULATION and self.grille_obstacles[int(y) * LARGEUR_SIMULATION + int(x)] == 1
+
+    def point_dans_brouillage(self, x, y):
+        return 0 <= x < LARGEUR_SIMULATION and 0 <= y < HAUTEUR_SIMULATION and self.grille_brouillage[int(y) * LARGEUR_SIMULATION + int(x)] == 1
+
+    def cle_monde(self):
+        """Empreinte de la graine et de tous les paramètres de génération : deux simulations de même clé ont le même monde"""
+        parametres = {
+            "version": VERSION_CACHE_MONDES, "seed": self.seed,
+            "taille": [LARGEUR_SIMULATION, HAUTEUR_SIMULATION], "spawn": [self.spawn_x, self.spawn_y],
+            "obstacles": [self.min_obstacle_percent, self.max_obstacle_percent],
+            "brouillage": [self.min_brouillage_percent, self.max_brouillage_percent],
+        }
+        return hashlib.sha256(json.dumps(parametres, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def chemin_cache_monde(self):
+        """Fichier de cache disque du monde"""
+        return os.path.join(CACHE_MONDES_DIR, f"{self.cle_monde()}.npz")
+
+    def memoriser_monde(self, cle):
+        """Garde le monde en mémoire pour les simulations suivantes du processus (les plus anciens sont oubliés)"""
+        if cle not in _MONDES_EN_MEMOIRE and len(_MONDES_EN_MEMOIRE) >= TAILLE_MEMOIRE_MONDES:
+            del _MONDES_EN_MEMOIRE[next(iter(_MONDES_EN_MEMOIRE))]
+        _MONDES_EN_MEMOIRE[cle] = (
+            self.obstacles, self.brouillages, self.homme_a_la_mer,
+            self.pourcentage_obstacle_reel, self.pourcentage_brouillage_reel,
+            self.grille_obstacles_np, self.grille_brouillage_np, self.grille_obstacles, self.grille_brouillage,
+            self.image_zone, self.hash_scenario
+        )
+
+    def reprendre_monde(self, monde):
+        """Reprend un monde mémorisé : les objets et grilles, jamais modifiés pendant une mission, sont partagés"""
+        (obstacles, brouillages, self.homme_a_la_mer,
+         self.pourcentage_obstacle_reel, self.pourcentage_brouillage_reel,
+         self.grille_obstacles_np, self.grille_brouillage_np, self.grille_obstacles, self.grille_brouillage,
+         self.image_zone, self.hash_scenario) = monde
+        self.obstacles, self.brouillages = list(obstacles), list(brouillages)
+
+    def charger_monde(self):
+        """Recharge le monde depuis le cache disque ; False s'il n'y est pas (ou est illisible)"""
+        chemin = self.chemin_cache_monde()
+        if not os.path.exists(chemin): return False
+        try:
+            with np.load(chemin) as monde:
+                self.obstacles = [Obstacle(*r) for r in monde["obstacles"].tolist()]
+                self.brouillages = [Brouillage(*r) for r in monde["brouillages"].tolist()]
+                self.homme_a_la_mer = HommeALaMer(*monde["homme_a_la_mer"].tolist())
+                self.pourcentage_obstacle_reel, self.pourcentage_brouillage_reel = monde["pourcentages_reels"].tolist()
+                self.grille_obstacles_np, self.grille_brouillage_np = monde["grille_obstacles"], monde["grille_brouillage"]
+                self.image_zone = monde["image_zone"].tobytes() or None
+        except Exception as e:
+            print(f"[{self.simulation_id}] Cache monde illisible, régénération: {e}")
+            self.obstacles, self.brouillages, self.homme_a_la_mer = [], [], None
+            return False
+        self.grille_obstacles = self.grille_obstacles_np.tobytes()
+        self.grille_brouillage = self.grille_brouillage_np.tobytes()
+        return True
+
+    def sauvegarder_monde(self):
+        """Écrit le monde dans le cache (fichier temporaire puis renommage, sûr entre processus)"""
+        chemin = self.chemin_cache_monde()
+        try:
+            os.makedirs(CACHE_MONDES_DIR, exist_ok=True)
+            # L'aperçu n'est rendu que si une image est demandée ; sinon generer_image_zone le fera à la demande
+            if self.image_zone is None and self.image_dir: self.image_zone = self.rendre_image_zone()
+            temporaire = f"{chemin}.{os.getpid()}.tmp"
+            with open(temporaire, 'wb') as f:
+                np.savez_compressed(
+                    f,
+                    obstacles=np.array([[o.x, o.y, o.largeur, o.hauteur] for o in self.obstacles], dtype=np.int32).reshape(-1, 4),
+                    brouillages=np.array([[b.x, b.y, b.largeur, b.hauteur] for b in self.brouillages], dtype=np.int32).reshape(-1, 4),
+                    homme_a_la_mer=np.array([self.homme_a_la_mer.x, self.homme_a_la_mer.y], dtype=np.int32),
+                    pourcentages_reels=np.array([self.pourcentage_obstacle_reel, self.pourcentage_brouillage_reel]),
+                    grille_obstacles=self.grille_obstacles_np, grille_brouillage=self.grille_brouillage_np,
+                    image_zone=np.frombuffer(self.image_zone or b"", dtype=np.uint8)
+                )
+            os.replace(temporaire, chemin)
+        except Exception as e:
+            print(f"[{self.simulation_id}] Erreur sauvegarde cache monde: {e}")
+
+    def calculer_hash_scenario(self):
+        """Empreinte SHA-256 stable du monde généré, pour comparer ou rejouer un scénario"""
+        contenu = {
+            "taille": [LARGEUR_SIMULATION, HAUTEUR_SIMULATION],
+            "spawn": [self.spawn_x, self.spawn_y],
+            "obstacles": [[o.x, o.y, o.largeur, o.hauteur] for o in self.obstacles],
+            "brouillages": [[b.x, b.y, b.largeur, b.hauteur] for b in self.brouillages],
+            "homme_a_la_mer": [self.homme_a_la_mer.x, self.homme_a_la_mer.y],
+        }
+        return hashlib.sha256(json.dumps(contenu, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def rendre_image_zone(self):
+        """Aperçu PNG du monde, en octets"""
         try:
             img = Image.new('RGB', (LARGEUR_SIMULATION, HAUTEUR_SIMULATION), 'white')
             draw = ImageDraw.Draw(img)
@@ -324,20 +496,33 @@ class Simulation:
             for b in self.brouillages: draw.rectangle([b.x, b.y, b.x + b.largeur, b.y + b.hauteur], fill=VIOLET)
             r = 10; draw.ellipse([self.homme_a_la_mer.x-r, self.homme_a_la_mer.y-r, self.homme_a_la_mer.x+r, self.homme_a_la_mer.y+r], fill=JAUNE)
             r = 15; draw.ellipse([self.spawn_x-r, self.spawn_y-r, self.spawn_x+r, self.spawn_y+r], outline=VERT, width=3)
-            img.save(os.path.join(self.image_dir, f"{self.simulation_id}_zone.png"))
+            tampon = io.BytesIO()
+            img.save(tampon, format="PNG")
+            return tampon.getvalue()
+        except Exception as e:
+            print(f"[{self.simulation_id}] Erreur image: {e}")
+            return None
+
+    def generer_image_zone(self):
+        if self.image_zone is None: self.image_zone = self.rendre_image_zone()
+        if self.image_zone is None: return
+        try:
+            with open(os.path.join(self.image_dir, f"{self.simulation_id}_zone.png"), 'wb') as f:
+                f.write(self.image_zone)
         except Exception as e:
             print(f"[{self.simulation_id}] Erreur image: {e}")
 
     def mettre_a_jour(self):
         if self.pause_automatique: return
         
-        if time.time() - self.temps_debut > TEMPS_MISSION_MAX_SECONDES:
+        if self.horloge.maintenant() - self.temps_debut > TEMPS_MISSION_MAX_SECONDES:
             self.pause_automatique, self.simulation_reussie, self.raison_echec = True, False, "Temps écoulé"
             return
         if not self.homme_a_la_mer_decouvert and all(c.epuise for c in self.creatures):
             self.pause_automatique, self.simulation_reussie, self.raison_echec = True, False, "Épuisement des drones"
             return
             
+        self.horloge.avancer()
         for c in self.creatures:
             c.deplacer(self.obstacles, self.homme_a_la_mer, self.creatures, self.brouillages, self)
             if c.a_trouve_homme_mer and not self.homme_a_la_mer_decouvert:
@@ -347,11 +532,21 @@ class Simulation:
                 self.qui_a_trouve_homme_mer = f"{c.type_creature}_{c.creature_id}"
                 self.pause_automatique = True
                 break
-        
-        self.zones_explorees.update(*(c.zone_exploree for c in self.creatures))
+
     
+    def resultat_compact(self, index_config):
+        """Résumé d'une mission pour les études statistiques, sans écriture sur disque"""
+        return ResultatMission(
+            index_config, self.seed, self.hash_scenario, self.simulation_reussie,
+            None if self.simulation_reussie else self.raison_echec,
+            self.premiere_decouverte_homme_mer - self.temps_debut if self.premiere_decouverte_homme_mer is not None else None,
+            self.qui_a_trouve_homme_mer, self.horloge.ticks, len(self.zones_explorees),
+            self.comms_surface_surface + self.comms_surface_aerien + self.comms_aerien_aerien,
+            sum(1 for c in self.creatures if c.epuise)
+        )
+
     def sauvegarder_statistiques(self):
-        self.temps_fin = time.time()
+        self.temps_fin = self.horloge.maintenant()
         duree = self.temps_fin - self.temps_debut
         
         stats_surface = self._calculer_stats_type("drone_de_surface")
@@ -363,16 +558,18 @@ class Simulation:
         drones_communicants = sum(1 for c in self.creatures if len(c.communications_reçues) > 0)
         creatures_epuisees = sum(1 for c in self.creatures if c.epuise)
         
-        temps_decouverte = self.premiere_decouverte_homme_mer - self.temps_debut if self.premiere_decouverte_homme_mer else None
+        temps_decouverte = self.premiere_decouverte_homme_mer - self.temps_debut if self.premiere_decouverte_homme_mer is not None else None
         
         statistiques = {
             "timestamp": datetime.now().isoformat(),
             "duree_simulation_secondes": round(duree, 2),
             "simulation_reussie": self.simulation_reussie,
-            "temps_decouverte_homme_mer": round(temps_decouverte, 2) if temps_decouverte else None,
+            "temps_decouverte_homme_mer": round(temps_decouverte, 2) if temps_decouverte is not None else None,
+            "raison_echec": None if self.simulation_reussie else self.raison_echec,
             "qui_a_trouve_homme_mer": self.qui_a_trouve_homme_mer,
             
             "configuration": {
+                "seed": self.seed, "hash_scenario": self.hash_scenario,
                 "nombre_drones_surface": self.nb_drones_surface, "nombre_drones_aerien": self.nb_drones_aerien,
                 "spawn_position": [self.spawn_x, self.spawn_y],
                 "homme_a_la_mer_position": [self.homme_a_la_mer.x, self.homme_a_la_mer.y],
@@ -470,18 +667,26 @@ class Simulation:
 # SECTION 3: FONCTION D'EXÉCUTION
 # =============================================================================
 
-def run_single_simulation(simulation_id, image_dir=None, stats_dir=None):
-    print(f"[Sim-{simulation_id}] Lancement...")
-    start_time = time.time()
-    
-    config = {
+ResultatMission = namedtuple("ResultatMission", [
+    "config", "seed", "hash_scenario", "reussie", "raison_echec", "temps_decouverte", "qui_a_trouve",
+    "ticks", "zones_explorees", "communications_reussies", "creatures_epuisees"
+])
+
+def config_par_defaut():
+    return {
         'nb_drones_surface': NB_DRONES_SURFACE_DEFAUT, 'nb_drones_aerien': NB_DRONES_AERIEN_DEFAUT,
         'spawn_x': SPAWN_X_DEFAUT, 'spawn_y': SPAWN_Y_DEFAUT,
         'min_obstacle_percent': MIN_OBSTACLE_PERCENT, 'max_obstacle_percent': MAX_OBSTACLE_PERCENT,
         'min_brouillage_percent': MIN_BROUILLAGE_PERCENT, 'max_brouillage_percent': MAX_BROUILLAGE_PERCENT,
     }
+
+def run_single_simulation(simulation_id, image_dir=None, stats_dir=None, seed=None):
+    print(f"[Sim-{simulation_id}] Lancement...")
+    start_time = time.time()
+    
+    config = config_par_defaut()
     
-    sim = Simulation(f"Sim-{simulation_id}", config, image_dir, stats_dir)
+    sim = Simulation(f"Sim-{simulation_id}", config, image_dir, stats_dir, seed)
     while not sim.pause_automatique:
         sim.mettre_a_jour()
 
@@ -494,6 +699,53 @@ def run_single_simulation(simulation_id, image_dir=None, stats_dir=None):
     
     return stats_path
 
+def _initialiser_worker():
+    """Préchauffe chaque processus une seule fois : les tables de disques d'exploration restent en mémoire d'un lot à l'autre"""
+    for type_creature in ("drone_de_surface", "drone_aerien"):
+        decalages_disque(Drone(0, 0, 0, 0, type_creature).zone_decouverte // 10)
+
+def executer_scenarios(scenarios):
+    """Exécute un lot de scénarios (index_config, config, seed) dans le processus courant"""
+    resultats = []
+    for index_config, config, seed in scenarios:
+        sim = Simulation(f"Batch-{index_config}-{seed}", config, seed=seed)
+        while not sim.pause_automatique:
+            sim.mettre_a_jour()
+        sim.temps_fin = sim.horloge.maintenant()
+        resultats.append(sim.resultat_compact(index_config))
+    return resultats
+
+def run_batch(configs, seeds, processus=PROCESSUS_PARALLELES_MAX, taille_lot=None):
+    """
+    Lance chaque configuration sur chaque graine et renvoie une liste de
+    ResultatMission, sans logs ni fichiers de statistiques. Les configurations
+    complètent config_par_defaut(). Les scénarios sont envoyés par lots à un
+    pool de processus préchauffés plutôt qu'un futur par simulation ; les lots
+    suivent l'ordre des graines pour que chaque processus réutilise ses mondes.
+    """
+    scenarios = [(index_config, {**config_par_defaut(), **config}, seed) for index_config, config in enumerate(configs) for seed in seeds]
+    if not scenarios:
+        return []
+    # Regroupés par monde (graine puis paramètres de génération) : les scénarios
+    # d'un même lot réutilisent le monde gardé en mémoire par le processus
+    def cle_monde(position):
+        _, config, seed = scenarios[position]
+        return (str(seed), config['spawn_x'], config['spawn_y'], config['min_obstacle_percent'], config['max_obstacle_percent'],
+                config['min_brouillage_percent'], config['max_brouillage_percent'])
+    positions = sorted(range(len(scenarios)), key=cle_monde)
+    if taille_lot is None:
+        # Quelques lots par processus pour équilibrer la charge sans multiplier les allers-retours
+        taille_lot = max(1, math.ceil(len(scenarios) / (processus * 4)))
+    lots = [[scenarios[p] for p in positions[i:i + taille_lot]] for i in range(0, len(positions), taille_lot)]
+
+    # Résultats rendus dans l'ordre des scénarios (configuration puis graine)
+    resultats = [None] * len(scenarios)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processus, initializer=_initialiser_worker) as executor:
+        for debut, lot in zip(range(0, len(positions), taille_lot), executor.map(executer_scenarios, lots)):
+            for position, resultat in zip(positions[debut:debut + taille_lot], lot):
+                resultats[position] = resultat
+    return resultats
+
 # =============================================================================
 # SECTION 4: LANCEUR PRINCIPAL
 # =============================================================================
@@ -7,14 +7,18 @@ from .HommeALaMer import HommeALaMer
 
 
 class Boat:
-    def __init__(self, speed=2):
+    def __init__(self, speed=2, horloge=None, rng=None):
         """
         Boat that moves across the map in a random direction and can drop a man overboard.
+        The simulation clock (if any) is shared with the boat's base and drones,
+        and so is the random generator (the global random module by default).
         """
+        rng = rng if rng is not None else random
+        self.rng = rng
 
-        angle = random.uniform(-math.pi / 6, math.pi / 6)
+        angle = rng.uniform(-math.pi / 6, math.pi / 6)
 
-        if random.choice(["left", "right"]) == "left":
+        if rng.choice(["left", "right"]) == "left":
             self.x = -40
             self.direction_vector = (math.cos(angle), math.sin(angle))
         else:
@@ -22,7 +26,7 @@ class Boat:
             self.direction_vector = (-math.cos(angle), math.sin(angle))
             angle = math.pi - angle
 
-        self.y = random.randint(100, constant.HAUTEUR_SIMULATION - 100)
+        self.y = rng.randint(100, constant.HAUTEUR_SIMULATION - 100)
 
         self.speed = speed
         self.sizeX = 100
@@ -38,6 +42,8 @@ class Boat:
         self.start_cone = []
         self.splash_timer = 0
         self.splash_pos = None
+        self.hull_sprite = None # Rotated hull, rebuilt only when the angle changes
+        self.hull_sprite_angle = None
 
 
         boat_center_x = self.x
@@ -52,7 +58,9 @@ class Boat:
             self.direction_vector[1],
             "base",
             None,
-            0
+            0,
+            horloge,
+            rng
         )
 
         half_width = self.sizeX / 2
@@ -81,7 +89,9 @@ class Boat:
                 self.direction_vector[1],
                 "drone_aerien",
                 None,
-                i
+                i,
+                horloge,
+                rng
             )
             self.drones.append(drone)
 
@@ -135,8 +145,8 @@ class Boat:
         if not self.has_dropped_man:
             self.has_dropped_man = True
             drop_distance = 30
-            drop_x = self.x - self.direction_vector[0] * drop_distance + random.randint(10, 50)
-            drop_y = self.y - self.direction_vector[1] * drop_distance +  random.randint(10, 50)
+            drop_x = self.x - self.direction_vector[0] * drop_distance + self.rng.randint(10, 50)
+            drop_y = self.y - self.direction_vector[1] * drop_distance +  self.rng.randint(10, 50)
 
             self.man_overboard = HommeALaMer(drop_x, drop_y)
 
@@ -168,12 +178,18 @@ class Boat:
         self.start_cone = (self.x, self.y)
         self.cone = cone_points
 
+    def get_hull_sprite(self):
+        """Hull surface rotated to the current heading, cached until the angle changes."""
+        if self.hull_sprite is None or self.hull_sprite_angle != self.angle:
+            boat_surface = pygame.Surface((self.sizeX, self.sizeY), pygame.SRCALPHA)
+            pygame.draw.rect(boat_surface, self.color, (0, 0, self.sizeX, self.sizeY))
+            self.hull_sprite = pygame.transform.rotate(boat_surface, -math.degrees(self.angle))
+            self.hull_sprite_angle = self.angle
+        return self.hull_sprite
+
     def display(self, screen):
         """Draw the boat, its base, its drones, and the man overboard if any."""
-        boat_surface = pygame.Surface((self.sizeX, self.sizeY), pygame.SRCALPHA)
-        pygame.draw.rect(boat_surface, self.color, (0, 0, self.sizeX, self.sizeY))
-
-        rotated_surface = pygame.transform.rotate(boat_surface, -math.degrees(self.angle))
+        rotated_surface = self.get_hull_sprite()
         rect = rotated_surface.get_rect(center=(self.x, self.y))
         screen.blit(rotated_surface, rect.topleft)
 
@@ -218,10 +234,12 @@ class Boat:
             mx, my = self.splash_pos
             radius = 10 + (120 - self.splash_timer) // 3
             alpha = max(0, min(255, int((self.splash_timer / 120) * 200)))
-            splash_surface = pygame.Surface((constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION), pygame.SRCALPHA)
-            pygame.draw.circle(splash_surface, (100, 180, 255, alpha), (int(mx), int(my)), radius, 3)
-            pygame.draw.circle(splash_surface, (180, 220, 255, alpha // 2), (int(mx), int(my)), radius + 5, 1)
-            screen.blit(splash_surface, (0, 0))
+            # Only the rings' bounding square, not the whole map
+            half_size = radius + 6
+            splash_surface = pygame.Surface((2 * half_size, 2 * half_size), pygame.SRCALPHA)
+            pygame.draw.circle(splash_surface, (100, 180, 255, alpha), (half_size, half_size), radius, 3)
+            pygame.draw.circle(splash_surface, (180, 220, 255, alpha // 2), (half_size, half_size), radius + 5, 1)
+            screen.blit(splash_surface, (int(mx) - half_size, int(my) - half_size))
 
             self.splash_timer -= 1
 
@@ -241,13 +259,3 @@ class Boat:
             pygame.draw.line(screen, (255, 255, 0), (int(self.x), int(self.y)), (int(left_x), int(left_y)), 2)
             pygame.draw.line(screen, (255, 255, 0), (int(self.x), int(self.y)), (int(right_x), int(right_y)), 2)
 
-            cone_surface = pygame.Surface((constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION), pygame.SRCALPHA)
-            cone_points = [
-                (int(self.x), int(self.y)),
-                (int(left_x), int(left_y)),
-                (int(right_x), int(right_y))
-            ]
-
-            # pygame.draw.polygon(cone_surface, (255, 255, 0, 60), cone_points)
-            screen.blit(cone_surface, (0, 0))
-
@@ -0,0 +1,200 @@
+import math
+import numpy as np
+from utils import constant
+
+class CarteZones:
+    """
+    Ensemble de cellules (zx, zy) de la grille d'exploration, stocké comme un
+    entier Python utilisé en bitset (un bit par cellule, ligne par ligne).
+    Union, différence et comptage deviennent des opérations bit à bit au lieu
+    de manipuler des milliers de tuples. L'interface reprend celle d'un set.
+    """
+    TAILLE_CELLULE = constant.TAILLE_CELLULE
+    LARGEUR = constant.LARGEUR_SIMULATION // constant.TAILLE_CELLULE
+    HAUTEUR = constant.HAUTEUR_SIMULATION // constant.TAILLE_CELLULE
+
+    PLEINE = (1 << (LARGEUR * HAUTEUR)) - 1
+
+    _spans_disque = {}
+
+    def __init__(self, bits=0):
+        self.bits = bits
+        self._nombre = None # Comptage mis en cache, tenu à jour par add/update
+
+    @classmethod
+    def index(cls, zx, zy):
+        return zy * cls.LARGEUR + zx
+
+    @classmethod
+    def dans_grille(cls, zx, zy):
+        return 0 <= zx < cls.LARGEUR and 0 <= zy < cls.HAUTEUR
+
+    @classmethod
+    def disque(cls, zx, zy, rayon):
+        """Cellules à distance <= rayon (en cellules) de (zx, zy), tronquées à la grille"""
+        spans = cls._spans_disque.get(rayon)
+        if spans is None:
+            spans = [(dy, math.isqrt(rayon * rayon - dy * dy)) for dy in range(-rayon, rayon + 1)]
+            cls._spans_disque[rayon] = spans
+        bits = 0
+        for dy, demi_largeur in spans:
+            y = zy + dy
+            if not 0 <= y < cls.HAUTEUR:
+                continue
+            x0 = max(0, zx - demi_largeur)
+            x1 = min(cls.LARGEUR - 1, zx + demi_largeur)
+            if x0 > x1:
+                continue
+            bits |= ((1 << (x1 - x0 + 1)) - 1) << cls.index(x0, y)
+        return cls(bits)
+
+    @classmethod
+    def complement(cls, *cartes):
+        """Cellules de la grille absentes de toutes les cartes données"""
+        bits = 0
+        for carte in cartes:
+            bits |= carte.bits
+        return cls(cls.PLEINE & ~bits)
+
+    @classmethod
+    def triangle(cls, v1, v2, v3):
+        """
+        Rasterise un triangle (en pixels) : cellules dont le centre est à
+        l'intérieur (test du signe des trois produits vectoriels).
+        """
+        def sign(p1, p2, p3):
+            return (p1[0] - p3[0]) * (p2[1] - p3[1]) - (p2[0] - p3[0]) * (p1[1] - p3[1])
+
+        t = cls.TAILLE_CELLULE
+        min_x = max(0, int(min(v1[0], v2[0], v3[0]) // t))
+        max_x = min(cls.LARGEUR, int(max(v1[0], v2[0], v3[0]) // t) + 1)
+        min_y = max(0, int(min(v1[1], v2[1], v3[1]) // t))
+        max_y = min(cls.HAUTEUR, int(max(v1[1], v2[1], v3[1]) // t) + 1)
+
+        bits = 0
+        for zy in range(min_y, max_y):
+            for zx in range(min_x, max_x):
+                centre = (zx * t + t / 2, zy * t + t / 2)
+                b1 = sign(centre, v1, v2) < 0.0
+                b2 = sign(centre, v2, v3) < 0.0
+                b3 = sign(centre, v3, v1) < 0.0
+                if b1 == b2 == b3:
+                    bits |= 1 << cls.index(zx, zy)
+        return cls(bits)
+
+    def _anneau(self, cx, cy, k, rayon):
+        """
+        Cellules présentes à distance de Tchebychev k de (cx, cy), limitées à la
+        fenêtre dx, dy dans [-rayon, rayon - 1] et à la grille.
+        """
+        if k == 0:
+            if (cx, cy) in self:
+                yield (cx, cy)
+            return
+        x0 = max(cx - k, cx - rayon, 0)
+        x1 = min(cx + k, cx + rayon - 1, self.LARGEUR - 1)
+        for dy in (-k, k):
+            zy = cy + dy
+            if not (-rayon <= dy < rayon and 0 <= zy < self.HAUTEUR) or x0 > x1:
+                continue
+            ligne = (self.bits >> self.index(x0, zy)) & ((1 << (x1 - x0 + 1)) - 1)
+            while ligne:
+                bit_bas = ligne & -ligne
+                yield (x0 + bit_bas.bit_length() - 1, zy)
+                ligne ^= bit_bas
+        for dx in (-k, k):
+            if not -rayon <= dx < rayon:
+                continue
+            for dy in range(max(-k + 1, -rayon), min(k, rayon)):
+                if (cx + dx, cy + dy) in self:
+                    yield (cx + dx, cy + dy)
+
+    def plus_proches(self, x, y, rayon):
+        """
+        Centres (en pixels) des cellules présentes les plus proches de (x, y),
+        ex aequo compris, dans une fenêtre de rayon cellules autour de (x, y).
+        Le parcours se fait par anneaux et s'arrête dès qu'aucun anneau plus
+        lointain ne peut battre la meilleure distance trouvée : le coût dépend
+        de la distance à la cible, pas de la taille de la fenêtre.
+        """
+        t = self.TAILLE_CELLULE
+        cx, cy = int(x // t), int(y // t)
+        meilleure_distance = float("inf")
+        meilleures_cibles = []
+        for k in range(rayon + 1):
+            # Une cellule de l'anneau k est au moins à t*k - t/2 du point
+            if meilleures_cibles and meilleure_distance < t * k - t / 2 - 1e-6:
+                break
+            for zx, zy in self._anneau(cx, cy, k, rayon):
+                cible_x = zx * t + t / 2
+                cible_y = zy * t + t / 2
+                distance = math.hypot(cible_x - x, cible_y - y)
+                if distance < meilleure_distance - 1e-6:
+                    meilleure_distance = distance
+                    meilleures_cibles = [(cible_x, cible_y)]
+                elif abs(distance - meilleure_distance) <= 1e-6:
+                    meilleures_cibles.append((cible_x, cible_y))
+        return meilleures_cibles
+
+    def masque(self):
+        """Tableau numpy uint8 (HAUTEUR, LARGEUR) valant 1 sur les cellules présentes"""
+        nombre_cellules = self.LARGEUR * self.HAUTEUR
+        octets = np.frombuffer(self.bits.to_bytes((nombre_cellules + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(octets, count=nombre_cellules, bitorder="little").reshape(self.HAUTEUR, self.LARGEUR)
+
+    def add(self, zone):
+        zx, zy = zone
+        bit = 1 << self.index(zx, zy)
+        if self._nombre is not None and not self.bits & bit:
+            self._nombre += 1
+        self.bits |= bit
+
+    def update(self, autre):
+        """Union en place ; le comptage est ajusté des seules cellules ajoutées"""
+        if self._nombre is not None:
+            ajout = autre.bits & ~self.bits
+            self._nombre += ajout.bit_count()
+            self.bits |= ajout
+        else:
+            self.bits |= autre.bits
+
+    def copy(self):
+        return CarteZones(self.bits)
+
+    def __contains__(self, zone):
+        zx, zy = zone
+        if not self.dans_grille(zx, zy):
+            return False
+        return (self.bits >> self.index(zx, zy)) & 1 == 1
+
+    def __len__(self):
+        if self._nombre is None:
+            self._nombre = self.bits.bit_count()
+        return self._nombre
+
+    def __bool__(self):
+        return self.bits != 0
+
+    def __iter__(self):
+        bits = self.bits
+        while bits:
+            bit_bas = bits & -bits
+            zy, zx = divmod(bit_bas.bit_length() - 1, self.LARGEUR)
+            yield (zx, zy)
+            bits ^= bit_bas
+
+    def __or__(self, autre):
+        return CarteZones(self.bits | autre.bits)
+
+    def __and__(self, autre):
+        return CarteZones(self.bits & autre.bits)
+
+    def __sub__(self, autre):
+        return CarteZones(self.bits & ~autre.bits)
+
+    def __ior__(self, autre):
+        self.update(autre)
+        return self
+
+    def __eq__(self, autre):
+        return isinstance(autre, CarteZones) and self.bits == autre.bits
@@ -0,0 +1,43 @@
+class CompteursFlotte:
+    ETATS = ("epuise", "en_repos", "retour_spawn")
+
+    def __init__(self):
+        """
+        Compteurs de la flotte par type de créature (effectif et drones dans
+        chaque état), tenus à jour par les drones à chaque changement d'état
+        plutôt que recomptés en parcourant toutes les créatures.
+        """
+        self.par_type = {}
+        self.communications_echouees = 0
+
+    def _compteurs(self, type_creature):
+        compteurs = self.par_type.get(type_creature)
+        if compteurs is None:
+            compteurs = self.par_type[type_creature] = dict.fromkeys(("total",) + self.ETATS, 0)
+        return compteurs
+
+    def ajouter(self, creature):
+        compteurs = self._compteurs(creature.type_creature)
+        compteurs["total"] += 1
+        for etat in self.ETATS:
+            compteurs[etat] += bool(getattr(creature, etat))
+        self.communications_echouees += creature.communications_echouees
+
+    def retirer(self, creature):
+        compteurs = self._compteurs(creature.type_creature)
+        compteurs["total"] -= 1
+        for etat in self.ETATS:
+            compteurs[etat] -= bool(getattr(creature, etat))
+        self.communications_echouees -= creature.communications_echouees
+
+    def changer_etat(self, type_creature, etat, valeur):
+        """Une créature entre (valeur True) dans l'état ou en sort (False)"""
+        self._compteurs(type_creature)[etat] += 1 if valeur else -1
+
+    def nombre(self, type_creature, etat="total"):
+        compteurs = self.par_type.get(type_creature)
+        return compteurs[etat] if compteurs else 0
+
+    def actifs(self, type_creature):
+        """Créatures du type qui ne sont pas épuisées"""
+        return self.nombre(type_creature) - self.nombre(type_creature, "epuise")
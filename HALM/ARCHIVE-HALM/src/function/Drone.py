@@ -2,11 +2,14 @@
 import pygame
 import random
 import math
-import time
 from utils import constant
+from utils import cache_rendu
+from .SimulationClock import SimulationClock
+from .CarteZones import CarteZones
+from .GrilleRectangles import GrilleRectangles
 
 class Drone:
-    def __init__(self, x, y, spawn_x, spawn_y, vx, vy, type_creature="drone_de_surface", logger=None, creature_id=0):
+    def __init__(self, x, y, spawn_x, spawn_y, vx, vy, type_creature="drone_de_surface", logger=None, creature_id=0, horloge=None, rng=None):
         self.x = x
         self.y = y
         self.spawn_x = spawn_x
@@ -15,12 +18,15 @@ class Drone:
         self.vy = vy
         self.type_creature = type_creature
         self.creature_id = creature_id
-        self.zone_exploree = set()
+        self.rng = rng if rng is not None else random # Générateur de la simulation, pour rejouer une mission à l'identique
+        self.zone_exploree = CarteZones()
         self.a_trouve_homme_mer = False
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.angle = self.rng.uniform(0, 2 * math.pi)
         self.temps_changement_direction = 0
         self.logger = logger
+        self.horloge = horloge if horloge is not None else SimulationClock()
         self.target = set()
+        self.cellule_sans_cible = None # Cellule où la dernière recherche de cible n'a rien trouvé
         self.link = []
         # Système de communication
         # Dans __init__ de ta classe (ex: Agent, Drone, etc.)
@@ -39,22 +45,28 @@ class Drone:
         self.tentatives_communication = 0
         self.homme_positions_connues = None
 
-        # États de repos
+        # États de repos (propriétés : chaque changement est reporté dans les compteurs de la flotte)
+        self.compteurs = None
         self.temps_depuis_spawn = 0
-        self.en_repos = False
+        self._en_repos = False
         self.temps_repos_debut = 0
-        self.retour_spawn = False
-        self.epuise = False
+        self._retour_spawn = False
+        self._epuise = False
         
         # Statistiques de trajet
         self.trajets_complets = 0
         self.temps_trajets = []
-        self.temps_debut_trajet = time.time()
+        self.temps_debut_trajet = self.horloge.maintenant()
         self.distance_parcourue = 0
         self.derniere_position = (x, y)
-        self.zones_decouvertes_uniques = set()
+        self.zones_decouvertes_uniques = CarteZones()
+        self.couverture_globale = None # Carte partagée de la simulation, alimentée au fil de l'exploration
+        self.compteur_connaissances = None # Nombre de drones connaissant chaque cellule (tableau numpy de la simulation)
+        self.grille_obstacles = None # Occupation des obstacles précalculée par la simulation
+        self.dans_brouillage = False # Mis en cache une fois par tick par la simulation
         self.temps_premiere_decouverte_homme_mer = None
         self.cone = None
+        self.masque_cone = None # Cellules du cône, rasterisées une fois et partagées par les drones du bateau
         self.start_cone = []
         
         # Caractéristiques selon le type
@@ -102,133 +114,72 @@ class Drone:
                 }
             })
     
-    def est_dans_zone_brouillage(self, brouillages):
-        """Vérifie si le drone se trouve dans une zone de brouillage"""
-        for brouillage in brouillages:
-            if brouillage.rect.collidepoint(self.x, self.y):
-                return True
-        return False
-
-    def communiquer_avec(self, autre_creature, brouillages, simulation):
-        """Établit une communication avec une autre créature"""
-        self.tentatives_communication += 1
-        
-        # Vérifier si l'un des drones est dans une zone de brouillage
-        if self.est_dans_zone_brouillage(brouillages) or autre_creature.est_dans_zone_brouillage(brouillages):
-            self.communications_echouees += 1
-            if self.logger:
-                self.logger.log_event("communication_failed_brouillage", {
-                    "creature_1": {"id": self.creature_id, "position": [self.x, self.y]},
-                    "creature_2": {"id": autre_creature.creature_id, "position": [autre_creature.x, autre_creature.y]},
-                    "reason": "brouillage"
-                })
-            return False
-        current_time = time.time()
-        # if autre_creature.creature_id in self.derniere_communication:
-        #     temps_derniere = self.derniere_communication[autre_creature.creature_id]
-        #     if current_time - temps_derniere < self.cooldown_communication:
-        #         return False
-
-        self.communications_reçues.add(autre_creature.creature_id)
-        autre_creature.communications_reçues.add(self.creature_id)
-
-        self.communications_envoyees += 1
-        autre_creature.communications_envoyees += 1
-
-        self.derniere_communication[autre_creature.creature_id] = current_time
-        autre_creature.derniere_communication[self.creature_id] = current_time
-
-        type1 = self.type_creature
-        type2 = autre_creature.type_creature
-
-        if type1 == "drone_de_surface" and type2 == "drone_de_surface":
-            simulation.comms_surface_surface += 1
-        elif type1 == "drone_aerien" and type2 == "drone_aerien":
-            simulation.comms_aerien_aerien += 1
-        else:
-            simulation.comms_surface_aerien += 1
-
-        if self.logger:
-            distance = math.sqrt((self.x - autre_creature.x)**2 + (self.y - autre_creature.y)**2)
-            self.logger.log_event("communication_established", {
-                "creature_1": {
-                    "id": self.creature_id,
-                    "type": self.type_creature,
-                    "position": [self.x, self.y]
-                },
-                "creature_2": {
-                    "id": autre_creature.creature_id,
-                    "type": autre_creature.type_creature,
-                    "position": [autre_creature.x, autre_creature.y]
-                },
-                "distance": round(distance, 2),
-                "communication_data": {
-                    "creature_1_contacts": len(self.communications_reçues),
-                    "creature_2_contacts": len(autre_creature.communications_reçues)
-                }
-            })
-        nouvelles_zones_recues = autre_creature.zone_exploree - self.zone_exploree
-        nouvelles_zones_envoyees = self.zone_exploree - autre_creature.zone_exploree
-
-        self.zone_exploree.update(autre_creature.zone_exploree)
-        autre_creature.zone_exploree.update(self.zone_exploree)
-        if not self.retour_spawn and  self.target:
-            zone = (self.target[0], self.target[1])
-            autre_creature.zone_exploree.update(zone)
-
-
-        self.zones_decouvertes_uniques.update(nouvelles_zones_recues)
-        autre_creature.zones_decouvertes_uniques.update(nouvelles_zones_envoyees)
-        if self.a_trouve_homme_mer:
-            autre_creature.a_trouve_homme_mer = True
-            autre_creature.homme_positions_connues = self.homme_positions_connues
-            autre_creature.temps_premiere_decouverte_homme_mer = self.temps_premiere_decouverte_homme_mer
-        return True
-    
-    def verifier_communications(self, autres_creatures, brouillages, simulation):
-        """Vérifie les communications et met à jour self.link (liste d'objets)"""
-        self.link = []
-        communications_etablies = 0
-
-        for autre in autres_creatures:
-            if autre.creature_id == self.creature_id or autre.epuise or self.epuise:
-                continue
+    @property
+    def en_repos(self):
+        return self._en_repos
+
+    @en_repos.setter
+    def en_repos(self, valeur):
+        self._changer_etat("en_repos", valeur)
+
+    @property
+    def retour_spawn(self):
+        return self._retour_spawn
+
+    @retour_spawn.setter
+    def retour_spawn(self, valeur):
+        self._changer_etat("retour_spawn", valeur)
+
+    @property
+    def epuise(self):
+        return self._epuise
+
+    @epuise.setter
+    def epuise(self, valeur):
+        self._changer_etat("epuise", valeur)
+
+    def _changer_etat(self, etat, valeur):
+        valeur = bool(valeur)
+        if valeur != getattr(self, "_" + etat):
+            setattr(self, "_" + etat, valeur)
+            if self.compteurs is not None:
+                self.compteurs.changer_etat(self.type_creature, etat, valeur)
+
+    def compter_echecs(self, nombre=1):
+        """Communications échouées, reportées aussi dans les compteurs de la flotte"""
+        self.communications_echouees += nombre
+        if self.compteurs is not None:
+            self.compteurs.communications_echouees += nombre
+
+    def tracer(self, message, *args):
+        """Trace de la machine à états, envoyée au tampon du logger (coupé par défaut)"""
+        if self.logger and self.logger.trace_active:
+            self.logger.trace(message, *args)
 
-            distance = math.hypot(self.x - autre.x, self.y - autre.y)
-            portee = (self.rayon_communication + autre.rayon_communication) / 2
-
-            if distance <= portee:
-                if self.communiquer_avec(autre, brouillages, simulation):
-                    self.link.append(autre)
-                    communications_etablies += 1
-
-        return communications_etablies
-    
     def deplacer(self, obstacles, homme_a_la_mer, autres_creatures, brouillages, simulation):
 
-        self.target = None
+        if self.epuise or self.en_repos or self.retour_spawn or not self.cible_a_garder():
+            self.target = None
         if self.epuise:
             return
 
-        self.temps_depuis_spawn += 1 / constant.FPS
-
-        if not self.en_repos:
-            self.verifier_communications(autres_creatures, brouillages, simulation)
+        self.temps_depuis_spawn += self.horloge.dt
 
+        # Les communications sont traitées pour toute la flotte par Simulation.communiquer_flotte
         dist_spawn = math.sqrt((self.x - self.spawn_x)**2 + (self.y - self.spawn_y)**2)
         if self.temps_depuis_spawn > self.temps_avant_repos and dist_spawn > 10:
                 self.epuise = True
         if self.retour_spawn:
             if self.gerer_retour_spawn(autres_creatures):
-                print(f"[LOG] Drone {self.creature_id} retourne au spawn.")
+                self.tracer("Drone %s retourne au spawn.", self.creature_id)
                 return
 
         elif self.en_repos:
             if self.gerer_repos():
-                print(f"[LOG] Drone {self.creature_id} reste en repos.")
+                self.tracer("Drone %s reste en repos.", self.creature_id)
                 return
             else:
-                print(f"[LOG] Drone {self.creature_id} sort du repos.")
+                self.tracer("Drone %s sort du repos.", self.creature_id)
 
         self.explorer(obstacles, homme_a_la_mer)
 
@@ -248,7 +199,7 @@ class Drone:
         temps_necessaire = distance_vers_cible / self.vitesse
         if temps_necessaire >= self.temps_avant_repos - self.temps_depuis_spawn:
             self.retour_spawn = True
-            print(f"[LOG] Drone {self.creature_id} passe en mode retour au spawn.")
+            self.tracer("Drone %s passe en mode retour au spawn.", self.creature_id)
             self.target = (self.spawn_x, self.spawn_y)
         else:
             return
@@ -286,7 +237,7 @@ class Drone:
     def entrer_en_repos(self):
         self.en_repos = True
         self.retour_spawn = False
-        self.temps_repos_debut = time.time()
+        self.temps_repos_debut = self.horloge.maintenant()
         self.x, self.y = self.spawn_x, self.spawn_y
 
         if self.logger:
@@ -298,8 +249,8 @@ class Drone:
                 "communications_count": len(self.communications_reçues)
             })
 
-        if self.temps_debut_trajet:
-            duree_trajet = time.time() - self.temps_debut_trajet
+        if self.temps_debut_trajet is not None:
+            duree_trajet = self.horloge.maintenant() - self.temps_debut_trajet
             self.temps_trajets.append(duree_trajet)
             self.trajets_complets += 1
             if self.logger:
@@ -312,13 +263,13 @@ class Drone:
                 })
 
     def gerer_repos(self):
-        temps_repos_actuel = time.time() - self.temps_repos_debut
-        print(f"[LOG] Drone {self.creature_id} en repos depuis {temps_repos_actuel:.2f}s., durée requise: {self.duree_repos}s.")
+        temps_repos_actuel = self.horloge.maintenant() - self.temps_repos_debut
+        self.tracer("Drone %s en repos depuis %.2fs., durée requise: %ss.", self.creature_id, temps_repos_actuel, self.duree_repos)
         if temps_repos_actuel >= self.duree_repos:
             self.en_repos = False
             self.retour_spawn = False
             self.temps_depuis_spawn = 0
-            self.temps_debut_trajet = time.time()
+            self.temps_debut_trajet = self.horloge.maintenant()
 
             if self.logger:
                 self.logger.log_event("creature_state_change", {
@@ -332,31 +283,44 @@ class Drone:
         else:
             return True
 
-    def zone_contient_obstacle(self, tx, ty, obstacles):
-        """Renvoie True si un obstacle occupe (même partiellement) la zone (tx, ty)."""
-        zone_rect = pygame.Rect(tx * 10, ty * 10, 10, 10)
-        for obstacle in obstacles:
-            if obstacle.rect.colliderect(zone_rect):
-                return True
-        return False
-    
+    def cible_a_garder(self):
+        """
+        La cible reste valable tant que sa cellule n'est pas connue : atteinte,
+        vue en passant ou apprise d'un autre drone.
+        """
+        if not self.target:
+            return False
+        t = constant.TAILLE_CELLULE
+        return (int(self.target[0] // t), int(self.target[1] // t)) not in self.zones_decouvertes_uniques
 
-    def point_in_triangle(self, pt, v1, v2, v3):
-        """Vérifie si un point pt est dans le triangle (v1, v2, v3)"""
-        x, y = pt
-        x1, y1 = v1
-        x2, y2 = v2
-        x3, y3 = v3
+    def choisir_cible(self):
+        """
+        Centre de la cellule inexplorée la plus proche, en priorité dans le cône
+        de recherche s'il y en a un ; None si rien n'est à portée.
+        """
+        cell_size = 10
+        max_range = 200
+        candidats = self.cellules_a_explorer()
 
-        def sign(p1, p2, p3):
-            return (p1[0] - p3[0]) * (p2[1] - p3[1]) - (p2[0] - p3[0]) * (p1[1] - p3[1])
+        if self.cone is not None:
+            if self.masque_cone is None:
+                self.masque_cone = CarteZones.triangle(*self.cone)
 
-        b1 = sign((x, y), (x1, y1), (x2, y2)) < 0.0
-        b2 = sign((x, y), (x2, y2), (x3, y3)) < 0.0
-        b3 = sign((x, y), (x3, y3), (x1, y1)) < 0.0
+            # Cellules du cône encore inconnues et libres : un simple ET de masques
+            best_targets = (candidats & self.masque_cone).plus_proches(self.x, self.y, max(CarteZones.LARGEUR, CarteZones.HAUTEUR))
+            if best_targets:
+                return self.rng.choice(best_targets)
 
-        return (b1 == b2) and (b2 == b3)
+        best_targets = candidats.plus_proches(self.x, self.y, max_range // cell_size)
+        if best_targets:
+            return self.rng.choice(best_targets)
+        return None
 
+    def cellules_a_explorer(self):
+        """Cellules libres d'obstacle que le drone ne connaît pas encore"""
+        if self.grille_obstacles is not None:
+            return CarteZones.complement(self.zones_decouvertes_uniques, self.grille_obstacles.occupation)
+        return CarteZones.complement(self.zones_decouvertes_uniques)
 
     def a_star(self, start, goal, grid):
         """
@@ -398,101 +362,24 @@ class Drone:
             self.retour_spawn = True
             return
 
-        cell_size = 10
-        max_range = 200
-        cone_cells_to_explore = []
-
-        if self.cone is not None and self.target is None:
-            v1, v2, v3 = self.cone
-            
-            # Définir la zone de recherche comme le rectangle englobant du cône
-            min_x = max(0, int(min(v1[0], v2[0], v3[0]) // cell_size))
-            max_x = min(constant.LARGEUR_SIMULATION // cell_size, int(max(v1[0], v2[0], v3[0]) // cell_size) + 1)
-            min_y = max(0, int(min(v1[1], v2[1], v3[1]) // cell_size))
-            max_y = min(constant.HAUTEUR_SIMULATION // cell_size, int(max(v1[1], v2[1], v3[1]) // cell_size) + 1)
-            
-            # Créer toutes les directions possibles dans le rectangle englobant
-            directions = []
-            for tx in range(min_x, max_x):
-                for ty in range(min_y, max_y):
-                    directions.append((tx, ty))
-            
-            # Mélanger aléatoirement comme dans l'algo original
-            random.shuffle(directions)
-            
-            best_dist = float("inf")
-            best_targets = []
-            
-            for tx, ty in directions:
-                # Vérifier si la cellule est dans le cône
-                cx_cell = tx * cell_size + cell_size / 2
-                cy_cell = ty * cell_size + cell_size / 2
-                if not self.point_in_triangle((cx_cell, cy_cell), v1, v2, v3):
-                    continue
-                    
-                zone = (tx, ty)
-                if zone in self.zones_decouvertes_uniques:
-                    continue
-                    
-                if self.zone_contient_obstacle(tx, ty, obstacles):
-                    self.zones_decouvertes_uniques.add(zone)
-                    continue
-                    
-                target_x = tx * cell_size + cell_size / 2
-                target_y = ty * cell_size + cell_size / 2
-                dist = math.hypot(target_x - self.x, target_y - self.y)
-                
-                if dist < best_dist - 1e-6:
-                    best_dist = dist
-                    best_targets = [(target_x, target_y)]
-                elif abs(dist - best_dist) <= 1e-6:
-                    best_targets.append((target_x, target_y))
-                    
-            if best_targets:
-                self.target = random.choice(best_targets)
-
-        if self.target is None:
-            R = max_range // cell_size
-            cx = int(self.x // cell_size)
-            cy = int(self.y // cell_size)
-
-            best_dist = float("inf")
-            best_targets = []
-            directions = [(dx, dy) for dx in range(-R, R) for dy in range(-R, R)]
-            random.shuffle(directions)
-            for dx, dy in directions:
-                tx, ty = cx + dx, cy + dy
-                if not (0 <= tx < constant.LARGEUR_SIMULATION // cell_size and
-                        0 <= ty < constant.HAUTEUR_SIMULATION // cell_size):
-                    continue
-                zone = (tx, ty)
-                if zone in self.zones_decouvertes_uniques:
-                    continue
-                if self.zone_contient_obstacle(tx, ty, obstacles):
-                    self.zones_decouvertes_uniques.add(zone)
-                    continue
-                target_x = tx * cell_size + cell_size / 2
-                target_y = ty * cell_size + cell_size / 2
-                dist = math.hypot(target_x - self.x, target_y - self.y)
-                if dist < best_dist - 1e-6:
-                    best_dist = dist
-                    best_targets = [(target_x, target_y)]
-                elif abs(dist - best_dist) <= 1e-6:
-                    best_targets.append((target_x, target_y))
-            if best_targets:
-                self.target = random.choice(best_targets)
+        # Sans cible, la recherche n'est refaite qu'au changement de cellule :
+        # les connaissances ne font que retirer des candidates
+        cellule = (int(self.x // constant.TAILLE_CELLULE), int(self.y // constant.TAILLE_CELLULE))
+        if self.target is None and cellule != self.cellule_sans_cible:
+            self.target = self.choisir_cible()
+            self.cellule_sans_cible = cellule if self.target is None else None
 
         if not self.en_repos and not self.retour_spawn:
             if self.target is not None:
                 self.angle = math.atan2(self.target[1] - self.y, self.target[0] - self.x)
             else:
-                self.angle += random.uniform(-0.3, 0.3)
+                self.angle += self.rng.uniform(-0.3, 0.3)
 
             if not self.en_repos and not self.retour_spawn:
                 if self.target is not None:
                     self.angle = math.atan2(self.target[1] - self.y, self.target[0] - self.x)
                 else:
-                    self.angle += random.uniform(-0.3, 0.3)
+                    self.angle += self.rng.uniform(-0.3, 0.3)
 
             if self.type_creature == "drone_de_surface" and self.target is not None:
                 if self.contournement_actif:
@@ -505,18 +392,10 @@ class Drone:
                     distance_vers_cible = math.hypot(dx, dy)
 
                     if distance_vers_cible > 0:
-                        pas = max(1, int(distance_vers_cible / 0.1))
-                        obstacle_trouve = None
-                        for i in range(1, pas + 1):
-                            t = i / pas
-                            check_x = self.x + dx * t
-                            check_y = self.y + dy * t
-                            for obstacle in obstacles:
-                                if obstacle.rect.collidepoint(check_x, check_y):
-                                    obstacle_trouve = obstacle
-                                    break
-                            if obstacle_trouve:
-                                break
+                        if self.grille_obstacles is not None:
+                            obstacle_trouve = self.grille_obstacles.premier_sur_segment(self.x, self.y, self.target[0], self.target[1])
+                        else:
+                            obstacle_trouve = GrilleRectangles.premier_sur_segment_parmi(obstacles, self.x, self.y, self.target[0], self.target[1])
 
                         if obstacle_trouve:
                             self.demarrer_contournement(obstacle_trouve, obstacles)
@@ -542,6 +421,8 @@ class Drone:
         )
 
         def point_dans_obstacle(px, py, liste_obs):
+            if self.grille_obstacles is not None:
+                liste_obs = self.grille_obstacles.candidats_point(px, py)
             for obs in liste_obs:
                 if obs.rect.collidepoint(px, py):
                     return True
@@ -575,9 +456,11 @@ class Drone:
 
         if nouvelle_pos_ok and self.type_creature == "drone_de_surface":
             nouvelle_rect = pygame.Rect(nouvelle_x - self.taille, nouvelle_y - self.taille, self.taille * 2, self.taille * 2)
+            if self.grille_obstacles is not None:
+                obstacles = self.grille_obstacles.candidats(nouvelle_rect)
             for obstacle in obstacles:
                 if nouvelle_rect.colliderect(obstacle.rect):
-                    self.angle = math.atan2(self.y - obstacle.y, self.x - obstacle.x) + random.uniform(-math.pi/4, math.pi/4)
+                    self.angle = math.atan2(self.y - obstacle.y, self.x - obstacle.x) + self.rng.uniform(-math.pi/4, math.pi/4)
                     nouvelle_pos_ok = False
                     break
 
@@ -587,7 +470,7 @@ class Drone:
             self.x, self.y = nouvelle_x, nouvelle_y
         else:
             self.angle += math.pi
-            if self.logger:
+            if self.logger and self.logger.is_enabled("boundary_hit"):
                 self.logger.log_event("boundary_hit", {
                     "creature_id": self.creature_id,
                     "creature_type": self.type_creature,
@@ -601,7 +484,7 @@ class Drone:
             self.a_trouve_homme_mer = True
             self.couleur = self.couleur_trouve
             self.homme_positions_connues = (homme_a_la_mer.x, homme_a_la_mer.y)
-            self.temps_premiere_decouverte_homme_mer = time.time()
+            self.temps_premiere_decouverte_homme_mer = self.horloge.maintenant()
 
             if self.logger:
                 self.logger.log_event("homme_a_la_mer_discovered", {
@@ -613,21 +496,24 @@ class Drone:
                     "communications_at_discovery": len(self.communications_reçues)
                 })
 
+    def connaitre_zones(self, zones):
+        """Ajoute des cellules aux zones connues et reporte les seules nouvelles dans le compteur partagé"""
+        if not zones:
+            return
+        if self.compteur_connaissances is not None:
+            ajout = zones - self.zones_decouvertes_uniques
+            if ajout:
+                self.compteur_connaissances += ajout.masque()
+        self.zones_decouvertes_uniques.update(zones)
+
     def mettre_a_jour_zones_explorees(self):
-        rayon = self.zone_decouverte // 10
-        nouvelles_zones = set()
-        for dx in range(-rayon, rayon + 1):
-            for dy in range(-rayon, rayon + 1):
-                if dx*dx + dy*dy <= rayon*rayon:
-                    zx, zy = int((self.x + dx*10) // 10), int((self.y + dy*10) // 10)
-                    if 0 <= zx < constant.LARGEUR_SIMULATION//10 and 0 <= zy < constant.HAUTEUR_SIMULATION//10:
-                        zone = (zx, zy)
-                        if zone not in self.zone_exploree:
-                            nouvelles_zones.add(zone)
-                        self.zone_exploree.add(zone)
-
-        if nouvelles_zones and self.logger:
-            self.logger.log_event("zones_explored", {
+        rayon = self.zone_decouverte // constant.TAILLE_CELLULE
+        zones_vues = CarteZones.disque(int(self.x // constant.TAILLE_CELLULE), int(self.y // constant.TAILLE_CELLULE), rayon)
+        nouvelles_zones = zones_vues - self.zone_exploree
+        self.zone_exploree.update(zones_vues)
+
+        if nouvelles_zones and self.logger and self.logger.is_enabled("zones_explored"):
+            self.logger.log_event("zones_explored", lambda: {
                 "creature_id": self.creature_id,
                 "creature_type": self.type_creature,
                 "new_zones_count": len(nouvelles_zones),
@@ -635,8 +521,24 @@ class Drone:
                 "position": [self.x, self.y]
             })
 
-        self.zones_decouvertes_uniques.update(nouvelles_zones)
+        self.connaitre_zones(nouvelles_zones)
+        if nouvelles_zones and self.couverture_globale is not None:
+            self.couverture_globale.update(nouvelles_zones)
+
 
+    def zone_dessin(self, afficher_cercles_communication):
+        """Rectangle (coordonnées de la simulation) couvrant tout ce que dessiner trace pour ce drone, liens exclus"""
+        # Corps, croix d'épuisement, numéro au-dessus et compteur "C:" en bas à droite
+        rect = pygame.Rect(int(self.x) - 10, int(self.y) - 16, 60, 38)
+        if self.epuise:
+            return rect
+        if afficher_cercles_communication and not self.dans_brouillage:
+            rayon = self.rayon_communication + 1
+            rect.union_ip(pygame.Rect(int(self.x) - rayon, int(self.y) - rayon, 2 * rayon + 1, 2 * rayon + 1))
+        if self.a_trouve_homme_mer:
+            rayon = self.zone_decouverte + 1
+            rect.union_ip(pygame.Rect(int(self.x) - rayon, int(self.y) - rayon, 2 * rayon + 1, 2 * rayon + 1))
+        return rect
 
     def dessiner(self, ecran_simulation, afficher_cercles_communication, brouillages):
         if self.epuise:
@@ -648,32 +550,20 @@ class Drone:
                            (self.x - taille_croix, self.y + taille_croix),
                            (self.x + taille_croix, self.y - taille_croix), 3)
         else:
-            if afficher_cercles_communication and not self.est_dans_zone_brouillage(brouillages):
-                surface_communication = pygame.Surface((self.rayon_communication * 2, self.rayon_communication * 2), pygame.SRCALPHA)
+            if afficher_cercles_communication and not self.dans_brouillage:
                 self.radar_progression += self.temps_depuis_spawn / constant.FPS
                 if self.radar_progression >= self.radar_duree:
                     self.radar_progression = 0.0
-                pygame.draw.circle(
-                    surface_communication,
-                    (*constant.BLANC, 30), 
-                    (self.rayon_communication, self.rayon_communication),
-                    self.rayon_communication,
-                    width=2
+                ecran_simulation.blit(
+                    cache_rendu.anneau_communication(self.rayon_communication),
+                    (self.x - self.rayon_communication, self.y - self.rayon_communication)
                 )
 
                 progression = self.radar_progression / self.radar_duree
-                rayon_radar = progression * self.rayon_communication
-                pygame.draw.circle(
-                    surface_communication,
-                    (*constant.BLANC, 180),
-                    (self.rayon_communication, self.rayon_communication),
-                    max(1, int(rayon_radar)),
-                    width=2
-                )
-
+                rayon_radar = max(1, int(progression * self.rayon_communication))
                 ecran_simulation.blit(
-                    surface_communication,
-                    (self.x - self.rayon_communication, self.y - self.rayon_communication)
+                    cache_rendu.impulsion_radar(rayon_radar),
+                    (self.x - rayon_radar, self.y - rayon_radar)
                 )
             if self.a_trouve_homme_mer:
                 pygame.draw.circle(ecran_simulation, (*self.couleur_trouve, 50), (int(self.x), int(self.y)), self.zone_decouverte, 2)
@@ -688,9 +578,7 @@ class Drone:
             else:
                 pygame.draw.circle(ecran_simulation, self.couleur, (int(self.x), int(self.y)), self.taille)
 
-            font_id = pygame.font.Font(None, 16)
-            text_id = font_id.render(str(self.creature_id), True, constant.NOIR)
-            ecran_simulation.blit(text_id, (self.x - 5, self.y - 15))
+            ecran_simulation.blit(cache_rendu.etiquette_id(self.creature_id), (self.x - 5, self.y - 15))
 
             if self.en_repos:
                 pygame.draw.circle(ecran_simulation, constant.VERT, (int(self.x), int(self.y - 10)), 2)
@@ -714,6 +602,5 @@ class Drone:
                     width=2
                 )
             if len(self.communications_reçues) > 0:
-                font_com = pygame.font.Font(None, 14)
-                text_com = font_com.render(f"C:{len(self.communications_reçues)}", True, constant.VIOLET)
+                text_com = cache_rendu.texte(f"C:{len(self.communications_reçues)}", 14, constant.VIOLET)
                 ecran_simulation.blit(text_com, (self.x + 8, self.y + 8))
@@ -0,0 +1,294 @@
+import math
+import numpy as np
+import pygame
+from utils import constant
+from .CarteZones import CarteZones
+
+class FleetState:
+    def __init__(self, drones, rng=None):
+        """
+        Moteur vectorisé de la flotte : positions, caps, minuteries et états
+        sont stockés dans des tableaux NumPy et avancés pour tous les drones à
+        la fois. Les objets Drone restent la référence pour les cartes, les
+        compteurs de communication et le dessin. À chaque tick, seuls les
+        champs lus par la simulation (position, cap, états) sont recopiés, et
+        seulement pour les drones qui ont bougé ou changé d'état ; le reste
+        (minuteries, distance, contournement, cible) l'est par synchroniser,
+        appelée avant le dessin et les statistiques. Les transitions rares
+        (arrivée au spawn, fin de repos, découverte, contournement) passent
+        par les méthodes habituelles des drones.
+        """
+        self.drones = list(drones)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.version = None # Version de la liste de créatures de la simulation au moment de la construction
+        n = len(self.drones)
+
+        def colonne(attribut, dtype=float):
+            return np.fromiter((getattr(d, attribut) for d in self.drones), dtype=dtype, count=n)
+
+        self.x = colonne("x")
+        self.y = colonne("y")
+        self.angle = colonne("angle")
+        self.vitesse = colonne("vitesse")
+        self.taille = colonne("taille")
+        self.zone_decouverte = colonne("zone_decouverte")
+        self.spawn_x = colonne("spawn_x")
+        self.spawn_y = colonne("spawn_y")
+        self.temps_depuis_spawn = colonne("temps_depuis_spawn")
+        self.temps_avant_repos = colonne("temps_avant_repos")
+        self.duree_repos = colonne("duree_repos")
+        self.temps_repos_debut = colonne("temps_repos_debut")
+        self.distance_parcourue = colonne("distance_parcourue")
+        self.en_repos = colonne("en_repos", bool)
+        self.retour_spawn = colonne("retour_spawn", bool)
+        self.epuise = colonne("epuise", bool)
+        self.a_trouve = colonne("a_trouve_homme_mer", bool)
+        self.contournement_actif = colonne("contournement_actif", bool)
+        self.frames_contournement = colonne("frames_contournement", int)
+
+        types = [d.type_creature for d in self.drones]
+        self.est_surface = np.array([t == "drone_de_surface" for t in types], dtype=bool)
+        self.est_base = np.array([t == "base" for t in types], dtype=bool)
+
+        # Cible courante, gardée jusqu'à ce que sa cellule soit connue comme dans Drone.deplacer
+        self.a_cible = np.zeros(n, dtype=bool)
+        self.cible_x = np.zeros(n)
+        self.cible_y = np.zeros(n)
+        # Cellule où la dernière recherche n'a rien trouvé (-1 : aucune)
+        self.sans_cible_x = np.full(n, -1)
+        self.sans_cible_y = np.full(n, -1)
+
+        # Dernière cellule explorée, pour ne recalculer les zones qu'au changement de cellule
+        self.cellule_x = np.full(n, -1)
+        self.cellule_y = np.full(n, -1)
+
+        # États tels que recopiés dans les objets, et drones passés par _vers_objet pendant le tick
+        self.ecrit_en_repos = self.en_repos.copy()
+        self.ecrit_retour_spawn = self.retour_spawn.copy()
+        self.ecrit_epuise = self.epuise.copy()
+        self.touches = np.zeros(n, dtype=bool)
+
+    def _vers_objet(self, i):
+        """Recopie l'état vectoriel d'un drone dans son objet avant d'appeler une de ses méthodes"""
+        d = self.drones[i]
+        self.touches[i] = True
+        d.x, d.y, d.angle = float(self.x[i]), float(self.y[i]), float(self.angle[i])
+        d.temps_depuis_spawn = float(self.temps_depuis_spawn[i])
+        d.en_repos, d.retour_spawn, d.epuise = bool(self.en_repos[i]), bool(self.retour_spawn[i]), bool(self.epuise[i])
+        d.temps_repos_debut = float(self.temps_repos_debut[i])
+        return d
+
+    def _depuis_objet(self, i):
+        """Relit l'état d'un drone après qu'une de ses méthodes l'a modifié"""
+        d = self.drones[i]
+        self.x[i], self.y[i], self.angle[i] = d.x, d.y, d.angle
+        self.temps_depuis_spawn[i] = d.temps_depuis_spawn
+        self.en_repos[i], self.retour_spawn[i], self.epuise[i] = d.en_repos, d.retour_spawn, d.epuise
+        self.temps_repos_debut[i] = d.temps_repos_debut
+        self.a_trouve[i] = d.a_trouve_homme_mer
+        self.contournement_actif[i] = d.contournement_actif
+        self.frames_contournement[i] = d.frames_contournement
+
+    def ecrire_vers_drones(self, bouge):
+        """
+        Recopie de fin de tick : position et cap des drones qui ont bougé,
+        états des drones dont un état a changé (ou qui sont passés par leurs
+        méthodes pendant le tick).
+        """
+        modifies = self.touches | (self.en_repos != self.ecrit_en_repos) | (self.retour_spawn != self.ecrit_retour_spawn) | (self.epuise != self.ecrit_epuise)
+        indices = np.flatnonzero(bouge | modifies)
+        for i, x, y, angle in zip(indices.tolist(), self.x[indices].tolist(), self.y[indices].tolist(), self.angle[indices].tolist()):
+            d = self.drones[i]
+            d.x, d.y, d.angle = x, y, angle
+
+        indices = np.flatnonzero(modifies)
+        for i, repos, retour, epuise in zip(indices.tolist(), self.en_repos[indices].tolist(), self.retour_spawn[indices].tolist(), self.epuise[indices].tolist()):
+            d = self.drones[i]
+            d.en_repos, d.retour_spawn, d.epuise = repos, retour, epuise
+        self.ecrit_en_repos[:] = self.en_repos
+        self.ecrit_retour_spawn[:] = self.retour_spawn
+        self.ecrit_epuise[:] = self.epuise
+        self.touches[:] = False
+
+    def synchroniser(self):
+        """Recopie complète dans les objets Drone (dessin, statistiques, reconstruction de la flotte)"""
+        colonnes = zip(
+            self.x.tolist(), self.y.tolist(), self.angle.tolist(), self.temps_depuis_spawn.tolist(),
+            self.en_repos.tolist(), self.retour_spawn.tolist(), self.epuise.tolist(),
+            self.temps_repos_debut.tolist(), self.distance_parcourue.tolist(),
+            self.contournement_actif.tolist(), self.frames_contournement.tolist(),
+            self.a_cible.tolist(), self.cible_x.tolist(), self.cible_y.tolist()
+        )
+        for d, (x, y, angle, tds, repos, retour, epuise, debut_repos, distance, contournement, frames, a_cible, cx, cy) in zip(self.drones, colonnes):
+            d.x, d.y, d.angle, d.temps_depuis_spawn = x, y, angle, tds
+            d.en_repos, d.retour_spawn, d.epuise = repos, retour, epuise
+            d.temps_repos_debut, d.distance_parcourue = debut_repos, distance
+            d.contournement_actif, d.frames_contournement = contournement, frames
+            d.target = (cx, cy) if a_cible else None
+
+    def _relire_decouvertes(self):
+        # La découverte de l'homme à la mer se propage pendant la phase de communication de la simulation
+        self.a_trouve = np.fromiter((d.a_trouve_homme_mer for d in self.drones), dtype=bool, count=len(self.drones))
+
+    def _oublier_cibles_connues(self, indices):
+        """Abandonne les cibles dont la cellule est désormais connue du drone (un test de bit par drone)"""
+        t = constant.TAILLE_CELLULE
+        bits = (self.cible_y[indices] // t).astype(int) * CarteZones.LARGEUR + (self.cible_x[indices] // t).astype(int)
+        for i, bit in zip(indices.tolist(), bits.tolist()):
+            if self.drones[i].zones_decouvertes_uniques.bits >> bit & 1:
+                self.a_cible[i] = False
+
+    def _choisir_cibles(self, indices, cellule_x, cellule_y):
+        """
+        Nouvelle cible des drones en exploration qui n'en ont pas, comme
+        Drone.explorer : un drone dont la recherche a échoué ne la refait
+        qu'après avoir changé de cellule.
+        """
+        indices = indices[(cellule_x[indices] != self.sans_cible_x[indices]) | (cellule_y[indices] != self.sans_cible_y[indices])]
+        for i in indices.tolist():
+            d = self.drones[i]
+            d.x, d.y = float(self.x[i]), float(self.y[i])
+            cible = d.choisir_cible()
+            self.a_cible[i] = cible is not None
+            if cible is not None:
+                self.cible_x[i], self.cible_y[i] = cible
+                self.sans_cible_x[i] = self.sans_cible_y[i] = -1
+            else:
+                self.sans_cible_x[i], self.sans_cible_y[i] = cellule_x[i], cellule_y[i]
+
+    def _cibles_retour(self, indices):
+        """Point de retour de chaque drone : la base la plus proche si elle est plus près que le spawn"""
+        cible_x = self.spawn_x[indices].copy()
+        cible_y = self.spawn_y[indices].copy()
+        if self.est_base.any() and len(indices):
+            bases_x, bases_y = self.x[self.est_base], self.y[self.est_base]
+            distances = np.hypot(self.x[indices, None] - bases_x[None, :], self.y[indices, None] - bases_y[None, :])
+            plus_proche = distances.argmin(axis=1)
+            dist_base = distances[np.arange(len(indices)), plus_proche]
+            dist_spawn = np.hypot(self.x[indices] - cible_x, self.y[indices] - cible_y)
+            vers_base = dist_base < dist_spawn
+            cible_x[vers_base] = bases_x[plus_proche[vers_base]]
+            cible_y[vers_base] = bases_y[plus_proche[vers_base]]
+        return cible_x, cible_y
+
+    def avancer(self, simulation):
+        """Avance toute la flotte d'un tick, dans le même ordre d'étapes que Drone.deplacer"""
+        maintenant = simulation.horloge.maintenant()
+        self._relire_decouvertes()
+
+        actifs = ~self.epuise
+        self.temps_depuis_spawn[actifs] += simulation.horloge.dt
+        dist_spawn = np.hypot(self.x - self.spawn_x, self.y - self.spawn_y)
+        self.epuise |= actifs & (self.temps_depuis_spawn > self.temps_avant_repos) & (dist_spawn > 10)
+
+        # Retour au spawn (ou à la base la plus proche)
+        retour = actifs & self.retour_spawn
+        indices_retour = np.flatnonzero(retour)
+        cible_x, cible_y = self._cibles_retour(indices_retour)
+        arrives = np.hypot(self.x[indices_retour] - cible_x, self.y[indices_retour] - cible_y) < 5
+        en_route = indices_retour[~arrives]
+        self.angle[en_route] = np.arctan2(cible_y[~arrives] - self.y[en_route], cible_x[~arrives] - self.x[en_route])
+        for i in indices_retour[arrives]:
+            self._vers_objet(i).entrer_en_repos()
+            self._depuis_objet(i)
+            self.a_cible[i] = False
+        arrive = np.zeros(len(self.drones), dtype=bool)
+        arrive[indices_retour[arrives]] = True
+
+        # Repos
+        repos = actifs & ~retour & self.en_repos
+        fin_repos = repos & (maintenant - self.temps_repos_debut >= self.duree_repos)
+        for i in np.flatnonzero(fin_repos):
+            self._vers_objet(i).gerer_repos()
+            self._depuis_objet(i)
+        bouge = actifs & ~arrive & ~(repos & ~fin_repos)
+
+        # Exploration (les bases immobiles n'ont pas besoin de cible)
+        self.retour_spawn |= bouge & self.a_trouve
+        libre = bouge & ~self.a_trouve & ~self.retour_spawn & ~self.en_repos
+        self.a_cible &= libre
+        self._oublier_cibles_connues(np.flatnonzero(self.a_cible))
+        t = constant.TAILLE_CELLULE
+        cellule_x = np.floor(self.x / t).astype(int)
+        cellule_y = np.floor(self.y / t).astype(int)
+        self._choisir_cibles(np.flatnonzero(libre & ~self.a_cible & (self.vitesse > 0)), cellule_x, cellule_y)
+        avec_cible = libre & self.a_cible
+        self.angle[avec_cible] = np.arctan2(self.cible_y[avec_cible] - self.y[avec_cible], self.cible_x[avec_cible] - self.x[avec_cible])
+        sans_cible = np.flatnonzero(libre & ~self.a_cible)
+        # Deux tirages, comme les deux blocs successifs de Drone.explorer
+        self.angle[sans_cible] += self.rng.uniform(-0.3, 0.3, len(sans_cible)) + self.rng.uniform(-0.3, 0.3, len(sans_cible))
+
+        # Contournement d'obstacle des drones de surface
+        surface = avec_cible & self.est_surface
+        en_contournement = surface & self.contournement_actif
+        self.frames_contournement[en_contournement] -= 1
+        self.contournement_actif[en_contournement & (self.frames_contournement <= 0)] = False
+        for i in np.flatnonzero(surface & ~en_contournement):
+            obstacle = simulation.grille_obstacles.premier_sur_segment(self.x[i], self.y[i], self.cible_x[i], self.cible_y[i])
+            if obstacle:
+                self._vers_objet(i).demarrer_contournement(obstacle, simulation.obstacles)
+                self._depuis_objet(i)
+
+        self.retour_spawn |= bouge & ~self.en_repos & ~self.retour_spawn & (self.temps_depuis_spawn >= self.temps_avant_repos / 2)
+
+        # Zones explorées : seulement pour les drones qui ont changé de cellule
+        # (les positions n'ont pas bougé depuis le calcul des cellules ci-dessus)
+        for i in np.flatnonzero(bouge & ((cellule_x != self.cellule_x) | (cellule_y != self.cellule_y))):
+            d = self.drones[i]
+            d.x, d.y = float(self.x[i]), float(self.y[i])
+            d.mettre_a_jour_zones_explorees()
+        self.cellule_x[bouge] = cellule_x[bouge]
+        self.cellule_y[bouge] = cellule_y[bouge]
+
+        self._mettre_a_jour_positions(bouge, simulation)
+        self._detecter_homme_a_la_mer(bouge, simulation.homme_a_la_mer)
+        self.ecrire_vers_drones(bouge)
+
+    def _mettre_a_jour_positions(self, bouge, simulation):
+        nouvelle_x = self.x + np.cos(self.angle) * self.vitesse
+        nouvelle_y = self.y + np.sin(self.angle) * self.vitesse
+        ok = bouge & (0 <= nouvelle_x) & (nouvelle_x < constant.LARGEUR_SIMULATION) & (0 <= nouvelle_y) & (nouvelle_y < constant.HAUTEUR_SIMULATION)
+
+        # Pré-filtre vectoriel : cellules des coins de la boîte du drone dans la grille d'occupation
+        surface = ok & self.est_surface
+        if surface.any():
+            t = constant.TAILLE_CELLULE
+            occupation = np.frombuffer(simulation.grille_obstacles.grille, dtype=np.uint8).reshape(CarteZones.HAUTEUR, CarteZones.LARGEUR)
+            marge = self.taille + 1
+            x0 = np.clip(np.floor((nouvelle_x - marge) / t).astype(int), 0, occupation.shape[1] - 1)
+            x1 = np.clip(np.floor((nouvelle_x + marge) / t).astype(int), 0, occupation.shape[1] - 1)
+            y0 = np.clip(np.floor((nouvelle_y - marge) / t).astype(int), 0, occupation.shape[0] - 1)
+            y1 = np.clip(np.floor((nouvelle_y + marge) / t).astype(int), 0, occupation.shape[0] - 1)
+            suspects = surface & ((occupation[y0, x0] | occupation[y0, x1] | occupation[y1, x0] | occupation[y1, x1]) > 0)
+            for i in np.flatnonzero(suspects):
+                taille = self.taille[i]
+                rect = pygame.Rect(nouvelle_x[i] - taille, nouvelle_y[i] - taille, taille * 2, taille * 2)
+                obstacle = simulation.grille_obstacles.premier_en_collision(rect)
+                if obstacle is not None:
+                    self.angle[i] = math.atan2(self.y[i] - obstacle.y, self.x[i] - obstacle.x) + self.rng.uniform(-math.pi / 4, math.pi / 4)
+                    ok[i] = False
+
+        compte = ok & ~self.epuise & ~self.en_repos
+        self.distance_parcourue[compte] += np.hypot(nouvelle_x[compte] - self.x[compte], nouvelle_y[compte] - self.y[compte])
+        self.x[ok] = nouvelle_x[ok]
+        self.y[ok] = nouvelle_y[ok]
+
+        bloques = bouge & ~ok
+        self.angle[bloques] += math.pi
+        for i in np.flatnonzero(bloques):
+            d = self.drones[i]
+            if d.logger and d.logger.is_enabled("boundary_hit"):
+                d.logger.log_event("boundary_hit", {
+                    "creature_id": d.creature_id,
+                    "creature_type": d.type_creature,
+                    "position": [float(self.x[i]), float(self.y[i])],
+                    "new_angle": float(self.angle[i])
+                })
+
+    def _detecter_homme_a_la_mer(self, bouge, homme_a_la_mer):
+        if homme_a_la_mer is None:
+            return
+        proches = bouge & ~self.a_trouve & (np.hypot(self.x - homme_a_la_mer.x, self.y - homme_a_la_mer.y) < self.zone_decouverte)
+        for i in np.flatnonzero(proches):
+            self._vers_objet(i).detecter_homme_a_la_mer(homme_a_la_mer)
+            self._depuis_objet(i)
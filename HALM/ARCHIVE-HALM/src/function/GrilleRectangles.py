@@ -0,0 +1,145 @@
+import math
+from utils import constant
+from .CarteZones import CarteZones
+
+class GrilleRectangles:
+    def __init__(self, elements=(), taille_cellule=constant.TAILLE_CELLULE):
+        """
+        Index à la résolution des cellules d'exploration pour des éléments
+        immobiles possédant un pygame.Rect (obstacles, zones de brouillage).
+        Construit une fois, il limite les tests exacts aux éléments des
+        cellules concernées.
+        """
+        self.taille_cellule = taille_cellule
+        self.reconstruire(elements)
+
+    def reconstruire(self, elements):
+        """Rasterise les éléments dans la grille (remplace l'index existant)"""
+        self.elements = list(elements)
+        self.cellules = {}
+        self.occupation = CarteZones()
+        self.grille = bytearray(CarteZones.LARGEUR * CarteZones.HAUTEUR)
+        self.couverture_complete = bytearray(CarteZones.LARGEUR * CarteZones.HAUTEUR)
+
+        t = self.taille_cellule
+        for index, element in enumerate(self.elements):
+            rect = element.rect
+            for cellule in self._cellules_rect(rect):
+                self.cellules.setdefault(cellule, []).append(index)
+                if CarteZones.dans_grille(*cellule):
+                    self.grille[CarteZones.index(*cellule)] = 1
+                    self.occupation.add(cellule)
+                    tx, ty = cellule
+                    if rect.left <= tx * t and (tx + 1) * t <= rect.right and rect.top <= ty * t and (ty + 1) * t <= rect.bottom:
+                        self.couverture_complete[CarteZones.index(tx, ty)] = 1
+
+    def _cellules_rect(self, rect):
+        """Cellules dont le carré a une intersection non vide avec rect (sémantique de colliderect)"""
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        t = self.taille_cellule
+        for tx in range(rect.left // t, (rect.right - 1) // t + 1):
+            for ty in range(rect.top // t, (rect.bottom - 1) // t + 1):
+                yield (tx, ty)
+
+    def candidats(self, rect):
+        """Éléments pouvant toucher rect, dans leur ordre d'origine"""
+        indices = set()
+        for cellule in self._cellules_rect(rect):
+            indices.update(self.cellules.get(cellule, ()))
+        return [self.elements[i] for i in sorted(indices)]
+
+    def candidats_point(self, x, y):
+        """Éléments pouvant contenir le point (x, y), dans leur ordre d'origine"""
+        cellule = (math.floor(x / self.taille_cellule), math.floor(y / self.taille_cellule))
+        return [self.elements[i] for i in self.cellules.get(cellule, ())]
+
+    def contient_point(self, x, y):
+        """
+        True si un élément contient le point (x, y). Les cellules vides ou
+        entièrement recouvertes répondent sans aucun test de rectangle.
+        """
+        tx, ty = math.floor(x / self.taille_cellule), math.floor(y / self.taille_cellule)
+        if CarteZones.dans_grille(tx, ty):
+            index = CarteZones.index(tx, ty)
+            if self.couverture_complete[index]:
+                return True
+            if not self.grille[index]:
+                return False
+        return self.premier_contenant(x, y) is not None
+
+    def premier_en_collision(self, rect):
+        """Premier élément dont le rect intersecte rect, ou None"""
+        for element in self.candidats(rect):
+            if element.rect.colliderect(rect):
+                return element
+        return None
+
+    def _cellules_segment(self, x0, y0, x1, y1):
+        """Cellules traversées par le segment (parcours DDA d'Amanatides-Woo)"""
+        t = self.taille_cellule
+        cx, cy = math.floor(x0 / t), math.floor(y0 / t)
+        fin_x, fin_y = math.floor(x1 / t), math.floor(y1 / t)
+        dx, dy = x1 - x0, y1 - y0
+        pas_x = 1 if dx > 0 else -1
+        pas_y = 1 if dy > 0 else -1
+        t_max_x = ((cx + (pas_x > 0)) * t - x0) / dx if dx else float("inf")
+        t_max_y = ((cy + (pas_y > 0)) * t - y0) / dy if dy else float("inf")
+        t_delta_x = t / abs(dx) if dx else float("inf")
+        t_delta_y = t / abs(dy) if dy else float("inf")
+
+        for _ in range(abs(fin_x - cx) + abs(fin_y - cy) + 1):
+            yield (cx, cy)
+            if t_max_x < t_max_y:
+                cx += pas_x
+                t_max_x += t_delta_x
+            else:
+                cy += pas_y
+                t_max_y += t_delta_y
+
+    @staticmethod
+    def entree_segment(x0, y0, x1, y1, rect):
+        """
+        Clipping de Liang-Barsky : paramètre t dans [0, 1] où le segment entre
+        dans rect, ou None s'il ne le traverse pas.
+        """
+        dx, dy = x1 - x0, y1 - y0
+        t_entree, t_sortie = 0.0, 1.0
+        for p, q in ((-dx, x0 - rect.left), (dx, rect.right - x0), (-dy, y0 - rect.top), (dy, rect.bottom - y0)):
+            if p == 0:
+                if q < 0:
+                    return None
+            elif p < 0:
+                t_entree = max(t_entree, q / p)
+            else:
+                t_sortie = min(t_sortie, q / p)
+        if t_entree >= t_sortie:
+            return None
+        return t_entree
+
+    @classmethod
+    def premier_sur_segment_parmi(cls, elements, x0, y0, x1, y1):
+        """Élément de la liste que le segment (x0, y0) -> (x1, y1) rencontre en premier"""
+        premier, t_premier = None, float("inf")
+        for element in elements:
+            t = cls.entree_segment(x0, y0, x1, y1, element.rect)
+            if t is not None and t < t_premier:
+                premier, t_premier = element, t
+        return premier
+
+    def premier_sur_segment(self, x0, y0, x1, y1):
+        """
+        Premier élément bloquant la ligne de vue (x0, y0) -> (x1, y1), ou None.
+        Seuls les éléments des cellules traversées sont clippés.
+        """
+        indices = set()
+        for cellule in self._cellules_segment(x0, y0, x1, y1):
+            indices.update(self.cellules.get(cellule, ()))
+        return self.premier_sur_segment_parmi([self.elements[i] for i in sorted(indices)], x0, y0, x1, y1)
+
+    def premier_contenant(self, x, y):
+        """Premier élément contenant le point (x, y), ou None"""
+        for element in self.candidats_point(x, y):
+            if element.rect.collidepoint(x, y):
+                return element
+        return None
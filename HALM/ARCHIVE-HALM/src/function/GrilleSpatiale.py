@@ -0,0 +1,58 @@
+import numpy as np
+
+class GrilleSpatiale:
+    # Moitié du voisinage 3 x 3 : chaque couple de cellules n'est examiné qu'une fois
+    DEMI_VOISINAGE = ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+    def __init__(self, taille_cellule=100):
+        """
+        Index spatial uniforme des créatures, reconstruit une fois par tick.
+        Deux créatures ne sont comparées que si elles occupent la même cellule
+        ou deux cellules adjacentes, au lieu de comparer toute la flotte.
+        Les créatures sont triées par clé de cellule : le contenu d'une
+        cellule est une tranche contiguë, retrouvée par recherche dichotomique.
+        """
+        self.taille_cellule = taille_cellule
+        self.cles = np.empty(0, dtype=np.int64)
+        self.cles_triees = np.empty(0, dtype=np.int64)
+        self.ordre = np.empty(0, dtype=np.int64)
+        self.hauteur = 1
+
+    def reconstruire(self, x, y, taille_cellule=None):
+        """Réindexe les positions (tableaux NumPy)"""
+        if taille_cellule:
+            self.taille_cellule = taille_cellule
+        cx = np.floor(x / self.taille_cellule).astype(np.int64)
+        cy = np.floor(y / self.taille_cellule).astype(np.int64)
+        if len(cx):
+            cx -= cx.min() - 1
+            cy -= cy.min() - 1
+        # Une ligne vide de part et d'autre : un décalage de cellule ne déborde jamais sur la colonne voisine
+        self.hauteur = int(cy.max()) + 2 if len(cy) else 1
+        self.cles = cx * self.hauteur + cy
+        self.ordre = np.argsort(self.cles, kind="stable")
+        self.cles_triees = self.cles[self.ordre]
+
+    def paires_candidates(self):
+        """Paires (i, j), i < j, de créatures dans la même cellule ou dans deux cellules adjacentes"""
+        morceaux_i, morceaux_j = [], []
+        indices = np.arange(len(self.cles))
+        for dx, dy in self.DEMI_VOISINAGE:
+            cibles = self.cles + dx * self.hauteur + dy
+            debut = np.searchsorted(self.cles_triees, cibles, side="left")
+            nombre = np.searchsorted(self.cles_triees, cibles, side="right") - debut
+            total = int(nombre.sum())
+            if not total:
+                continue
+            a = np.repeat(indices, nombre)
+            # Position de chaque voisin dans le tri : début de la tranche + rang dans la tranche
+            rang = np.arange(total) - np.repeat(np.cumsum(nombre) - nombre, nombre)
+            b = self.ordre[np.repeat(debut, nombre) + rang]
+            if dx == 0 and dy == 0:
+                garde = a < b
+                a, b = a[garde], b[garde]
+            morceaux_i.append(np.minimum(a, b))
+            morceaux_j.append(np.maximum(a, b))
+        if not morceaux_i:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(morceaux_i), np.concatenate(morceaux_j)
@@ -1,17 +1,182 @@
 import time
 import json
 import os
+import queue
+import threading
+import random
+import sys
+from collections import deque
 from datetime import datetime
 from utils import constant
 
 class Logger:
-    def __init__(self):
-        self.logs = []
+    # Événements émis à chaque frame ou à chaque contact, à couper en priorité
+    EVENEMENTS_HAUTE_FREQUENCE = ("zones_explored", "communication_established", "communication_failed_brouillage", "boundary_hit", "frame_state")
+
+    def __init__(self, dossier="logs", taille_max_fichier=50 * 1024 * 1024, taille_file=10000,
+                 evenements_desactives=(), echantillonnage=None, limites_par_seconde=None, haute_frequence=True,
+                 trace_active=False, taille_trace=5000):
+        """
+        Journal d'événements en flux : chaque événement est placé dans une file
+        bornée puis écrit en JSON Lines (une entrée par ligne, même schéma
+        qu'avant) par un thread d'écriture en arrière-plan. La mémoire reste
+        bornée quelle que soit la durée de la simulation ; quand le fichier
+        dépasse taille_max_fichier octets, l'écriture continue dans un nouveau
+        fichier numéroté. Les fichiers sont créés en mode exclusif : deux
+        journaux ouverts dans la même seconde ne s'écrasent pas. fermer()
+        ajoute une ligne de clôture (nombre de frames et durée).
+
+        Filtrage par type d'événement : evenements_desactives (coupés),
+        echantillonnage {type: ratio conservé entre 0 et 1} et
+        limites_par_seconde {type: nombre maximal d'événements par seconde}.
+        haute_frequence=False coupe d'un coup EVENEMENTS_HAUTE_FREQUENCE.
+
+        La trace (messages de débogage de la machine à états des drones) est
+        désactivée par défaut ; active, elle garde les taille_trace derniers
+        messages dans un tampon circulaire, vidé à la demande par vider_trace.
+        """
+        self.trace_active = trace_active
+        self.tampon_trace = deque(maxlen=taille_trace)
+        self.evenements_desactives = set(evenements_desactives)
+        if not haute_frequence:
+            self.desactiver_haute_frequence()
+        self.echantillonnage = dict(echantillonnage or {})
+        self.limites_par_seconde = dict(limites_par_seconde or {})
+        self.fenetres_debit = {} # type -> [début de la fenêtre d'une seconde, événements déjà émis]
+        self.rng = random.Random() # Propre au journal, pour ne pas perturber les tirages de la simulation
         self.frame_count = 0
         self.start_time = time.time()
-        
+        self.dossier = dossier
+        self.taille_max_fichier = taille_max_fichier
+        self.horodatage = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.nom_base = f"simulation_log_{self.horodatage}"
+        self.doublons = 0 # Journaux déjà présents avec le même horodatage
+        self.numero_fichier = 0
+        self.chemins = []
+
+        os.makedirs(self.dossier, exist_ok=True)
+        self.fichier = self._ouvrir_fichier()
+
+        self.file = queue.Queue(maxsize=taille_file)
+        self.thread_ecriture = threading.Thread(target=self._ecrire_en_continu, daemon=True)
+        self.thread_ecriture.start()
+
+    def _ouvrir_fichier(self):
+        """
+        Crée le fichier courant (sans jamais écraser un fichier existant) et y
+        écrit une ligne d'en-tête de métadonnées. Si le nom est déjà pris par
+        un journal de la même seconde, un numéro est ajouté au nom de base
+        (simulation_log_<date>-1.jsonl, -2...).
+        """
+        while True:
+            suffixe = f".{self.numero_fichier}" if self.numero_fichier else ""
+            chemin = os.path.join(self.dossier, f"{self.nom_base}{suffixe}.jsonl")
+            try:
+                fichier = open(chemin, 'x', encoding='utf-8')
+                break
+            except FileExistsError:
+                if self.numero_fichier:
+                    self.numero_fichier += 1
+                else:
+                    self.doublons += 1
+                    self.nom_base = f"simulation_log_{self.horodatage}-{self.doublons}"
+        fichier.write(json.dumps({"metadata": {
+            "fps": constant.FPS,
+            "screen_size": [constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION],
+            "created_at": datetime.now().isoformat(),
+            "part": self.numero_fichier
+        }}, ensure_ascii=False) + "\n")
+        self.chemins.append(chemin)
+        return fichier
+
+    def _ecrire_en_continu(self):
+        """Thread d'écriture : vide la file dans le fichier, avec rotation par taille"""
+        while True:
+            entree = self.file.get()
+            try:
+                if entree is None:
+                    self.fichier.flush()
+                    return
+                self.fichier.write(json.dumps(entree, ensure_ascii=False, default=str) + "\n")
+                if self.fichier.tell() >= self.taille_max_fichier:
+                    self.fichier.close()
+                    self.numero_fichier += 1
+                    self.fichier = self._ouvrir_fichier()
+                if self.file.empty():
+                    self.fichier.flush()
+            except Exception as e:
+                print(f"Erreur lors de l'écriture des logs: {e}")
+            finally:
+                self.file.task_done()
+
+    @property
+    def chemin(self):
+        """Fichier en cours d'écriture"""
+        return self.chemins[-1]
+
+    def is_enabled(self, event_type):
+        """Test bon marché à placer avant de construire un événement coûteux"""
+        return event_type not in self.evenements_desactives
+
+    def activer(self, event_type, actif=True):
+        if actif:
+            self.evenements_desactives.discard(event_type)
+        else:
+            self.evenements_desactives.add(event_type)
+
+    def desactiver_haute_frequence(self):
+        self.evenements_desactives.update(self.EVENEMENTS_HAUTE_FREQUENCE)
+
+    def _passe_filtres(self, event_type):
+        """Échantillonnage puis limite de débit (fenêtres successives d'une seconde)"""
+        ratio = self.echantillonnage.get(event_type)
+        if ratio is not None and self.rng.random() >= ratio:
+            return False
+        limite = self.limites_par_seconde.get(event_type)
+        if limite is not None:
+            maintenant = time.monotonic()
+            fenetre = self.fenetres_debit.get(event_type)
+            if fenetre is None or maintenant - fenetre[0] >= 1.0:
+                fenetre = self.fenetres_debit[event_type] = [maintenant, 0]
+            if fenetre[1] >= limite:
+                return False
+            fenetre[1] += 1
+        return True
+
+    def trace(self, message, *args):
+        """
+        Message de trace au format %, mis en forme seulement au vidage :
+        quand la trace est coupée, l'appel ne coûte qu'un test.
+        """
+        if self.trace_active:
+            self.tampon_trace.append((time.time() - self.start_time, self.frame_count, message, args))
+
+    def basculer_trace(self):
+        self.trace_active = not self.trace_active
+        return self.trace_active
+
+    def vider_trace(self, flux=None):
+        """Écrit le tampon de trace (par défaut sur stderr), le vide et renvoie le nombre de lignes"""
+        flux = flux if flux is not None else sys.stderr
+        entrees = list(self.tampon_trace)
+        self.tampon_trace.clear()
+        for timestamp, frame, message, args in entrees:
+            flux.write(f"[TRACE {timestamp:9.3f}s frame {frame}] {message % args}\n")
+        flux.flush()
+        return len(entrees)
+
     def log_event(self, event_type, data):
-        """Enregistre un événement avec timestamp"""
+        """
+        Enregistre un événement avec timestamp. data peut être une fonction
+        sans argument : le contenu n'est alors construit que si l'événement
+        passe les filtres.
+        """
+        if event_type in self.evenements_desactives:
+            return
+        if (self.echantillonnage or self.limites_par_seconde) and not self._passe_filtres(event_type):
+            return
+        if callable(data):
+            data = data()
         timestamp = time.time() - self.start_time
         log_entry = {
             "frame": self.frame_count,
@@ -19,15 +184,19 @@ class Logger:
             "event_type": event_type,
             "data": data
         }
-        self.logs.append(log_entry)
-    
+        # La sérialisation JSON se fait dans le thread d'écriture
+        self.file.put(log_entry)
+
     def log_frame(self, creatures_states, simulation_state):
         """Enregistre l'état complet d'une frame"""
+        if not self.is_enabled("frame_state"):
+            self.frame_count += 1
+            return
         frame_data = {
             "creatures": [],
             "simulation": simulation_state
         }
-        
+
         for i, creature in enumerate(creatures_states):
             creature_data = {
                 "id": i,
@@ -45,36 +214,29 @@ class Logger:
                 "communications_envoyees": creature.communications_envoyees
             }
             frame_data["creatures"].append(creature_data)
-        
+
         self.log_event("frame_state", frame_data)
         self.frame_count += 1
-    
-    def save_logs(self, filename=None):
-        """Sauvegarde les logs dans un fichier"""
-        if not os.path.exists("logs"):
-            os.makedirs("logs")
-        
-        if filename is None:
-            filename = f"simulation_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        filepath = os.path.join("logs", filename)
-        
-        log_data = {
-            "metadata": {
+
+    def save_logs(self):
+        """Attend que tous les événements en file soient écrits sur disque et renvoie le fichier courant"""
+        if not self.thread_ecriture.is_alive():
+            return None
+        self.file.join()
+        print(f"Logs sauvegardés dans: {self.chemin}")
+        return self.chemin
+
+    def fermer(self):
+        """
+        Écrit la ligne de clôture (total_frames, duration) après les derniers
+        événements, vide la file, arrête le thread d'écriture et ferme le fichier
+        """
+        if self.thread_ecriture.is_alive():
+            self.file.put({"trailer": {
                 "total_frames": self.frame_count,
                 "duration": time.time() - self.start_time,
-                "fps": constant.FPS,
-                "screen_size": [constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION],
-                "created_at": datetime.now().isoformat()
-            },
-            "events": self.logs
-        }
-        
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
-            print(f"Logs sauvegardés dans: {filepath}")
-            return filepath
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde des logs: {e}")
-            return None
\ No newline at end of file
+                "closed_at": datetime.now().isoformat()
+            }})
+            self.file.put(None)
+            self.thread_ecriture.join()
+        self.fichier.close()
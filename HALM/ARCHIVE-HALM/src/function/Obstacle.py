@@ -10,5 +10,6 @@ class Obstacle:
         self.hauteur = hauteur
         self.rect = pygame.Rect(x, y, largeur, hauteur)
     
-    def dessiner(self, ecran_simulation):
-        pygame.draw.rect(ecran_simulation, constant.MARRON, self.rect)
\ No newline at end of file
+    def dessiner(self, ecran_simulation, position=None):
+        rect = self.rect if position is None else pygame.Rect(position, self.rect.size)
+        pygame.draw.rect(ecran_simulation, constant.MARRON, rect)
\ No newline at end of file
@@ -1,21 +1,33 @@
 import random
 import pygame
-import time
 import os
 import json
-import threading
+import hashlib
 import math
+import numpy as np
 from utils import constant
 from datetime import datetime
 from utils import constant
+from utils import cache_rendu
 from .Drone import Drone
 from .Obstacle import Obstacle
 from .Brouillage import Brouillage
 from .HommeALaMer import HommeALaMer
 from .Boat import Boat
+from .SimulationClock import SimulationClock
+from .CarteZones import CarteZones
+from .GrilleRectangles import GrilleRectangles
+from .GrilleSpatiale import GrilleSpatiale
+from .FleetState import FleetState
+from .CompteursFlotte import CompteursFlotte
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
 
 class Simulation:
-    def __init__(self, nb_drones_surface=8, nb_drones_aerien=7, spawn_x=100, spawn_y=100, logger=None, pourcentage_brouillage=10, mode="classic"):
+    def __init__(self, nb_drones_surface=8, nb_drones_aerien=7, spawn_x=100, spawn_y=100, logger=None, pourcentage_brouillage=10, mode="classic", horloge=None, moteur="objets", seed=None):
         self.nb_drones_surface = nb_drones_surface
         self.nb_drones_aerien = nb_drones_aerien
         self.spawn_x = spawn_x
@@ -23,15 +35,18 @@ class Simulation:
         self.pourcentage_brouillage = pourcentage_brouillage
         self.pourcentage_brouillage_reel = 0 # Sera calculé dans generer_monde
         self.creatures = []
+        self.compteurs_flotte = CompteursFlotte()
         self.obstacles = []
         self.brouillages = []
         self.homme_a_la_mer = None
-        self.zones_explorees = set()
+        self.zones_explorees = CarteZones()
+        self.compteur_connaissances = np.zeros((CarteZones.HAUTEUR, CarteZones.LARGEUR), dtype=np.int32) # Drones connaissant chaque cellule
         self.homme_a_la_mer_decouvert = False
         self.temps_decouverte = 0
         self.logger = logger
         self.next_creature_id = 0
-        self.temps_debut = time.time()
+        self.horloge = horloge if horloge is not None else SimulationClock()
+        self.temps_debut = self.horloge.maintenant()
         self.temps_fin = None
         self.simulation_reussie = False
         self.premiere_decouverte_homme_mer = None
@@ -41,12 +56,31 @@ class Simulation:
         self.mode = mode
         self.cone = None
         self.start_cone = []
+        self.sprite_cone = None # (cône, surface recadrée, position), refait seulement quand le cône change
         self.base_coord = None
         self.homme_coord = None
         # Nouveaux compteurs de communication
         self.comms_surface_surface = 0
         self.comms_surface_aerien = 0
         self.comms_aerien_aerien = 0
+        self.grille_spatiale = GrilleSpatiale() # Recherche des paires sans scipy
+        self.grille_obstacles = GrilleRectangles() # Remplie par generer_monde, partagée par tous les drones
+        self.grille_brouillage = GrilleRectangles()
+        # Graine explicite : le monde (rng_monde) et le comportement des drones (rng) ont chacun leur générateur
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+        self.rng_monde = random.Random(self.seed)
+        self.rng = random.Random(f"{self.seed}:drones")
+        self.rng_numpy = np.random.default_rng([self.seed, 1])
+        self.hash_scenario = None
+        self.ecran_simulation = None # Surface de rendu et calques, construits à la fin de generer_monde
+        self.rafraichir_tout = True # Prochain rendu : tout l'écran est à mettre à jour
+        self.zones_sprites_precedentes = [] # Rectangles dessinés à la frame précédente (drones, liens), à effacer
+        self.surface_info = None # Panneau de statistiques, redessiné au plus toutes les PERIODE_PANNEAU_INFO_MS
+        self.lignes_info = None
+        self.dernier_rendu_info = None
+        self.moteur = moteur # "objets" (Drone.deplacer un par un) ou "vectoriel" (FleetState)
+        self.flotte = None
+        self.version_creatures = 0 # Incrémentée à chaque changement de la flotte, pour reconstruire FleetState
         
         self.generer_monde(mode)
         
@@ -59,6 +93,8 @@ class Simulation:
                     "screen_size": [constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION],
                     "communication_enabled": True,
                     "target_jamming_percentage": self.pourcentage_brouillage,
+                    "seed": self.seed,
+                    "scenario_hash": self.hash_scenario,
                 }
             })
     
@@ -68,10 +104,11 @@ class Simulation:
         return current_id
     
     def sauvegarder_statistiques(self):
+        self.synchroniser_flotte()
         if not os.path.exists("statistiques"):
             os.makedirs("statistiques")
         
-        duree_simulation = (self.temps_fin or time.time()) - self.temps_debut
+        duree_simulation = (self.temps_fin if self.temps_fin is not None else self.horloge.maintenant()) - self.temps_debut
         
         stats_drones_surface = self._calculer_stats_type("drone_de_surface")
         stats_drones_aerien = self._calculer_stats_type("drone_aerien")
@@ -89,17 +126,19 @@ class Simulation:
         pourcentage_exploration = (zones_totales_explorees / surface_carte) * 100
         
         temps_decouverte_homme_mer = None
-        if self.premiere_decouverte_homme_mer:
+        if self.premiere_decouverte_homme_mer is not None:
             temps_decouverte_homme_mer = self.premiere_decouverte_homme_mer - self.temps_debut
         
         statistiques = {
             "timestamp": datetime.now().isoformat(),
             "duree_simulation_secondes": round(duree_simulation, 2),
             "simulation_reussie": self.simulation_reussie,
-            "temps_decouverte_homme_mer": round(temps_decouverte_homme_mer, 2) if temps_decouverte_homme_mer else None,
+            "temps_decouverte_homme_mer": round(temps_decouverte_homme_mer, 2) if temps_decouverte_homme_mer is not None else None,
             "qui_a_trouve_homme_mer": self.qui_a_trouve_homme_mer,
             
             "configuration": {
+                "seed": self.seed,
+                "hash_scenario": self.hash_scenario,
                 "nombre_drones_surface": self.nb_drones_surface,
                 "nombre_drones_aerien": self.nb_drones_aerien,
                 "spawn_position": [self.spawn_x, self.spawn_y],
@@ -182,7 +221,7 @@ class Simulation:
         zones_decouvertes_total = sum(len(c.zones_decouvertes_uniques) for c in creatures_type)
         zones_decouverte_par_creature = zones_decouvertes_total / len(creatures_type)
         
-        duree_simulation = (self.temps_fin or time.time()) - self.temps_debut
+        duree_simulation = (self.temps_fin if self.temps_fin is not None else self.horloge.maintenant()) - self.temps_debut
         vitesse_exploration = zones_decouvertes_total / duree_simulation if duree_simulation > 0 else 0
         
         ont_trouve_homme_mer = sum(1 for c in creatures_type if (c.a_trouve_homme_mer and c.type_creature == "base"))
@@ -224,19 +263,19 @@ class Simulation:
         }
 
     def spawn_all_drones(self):
-        threading.Timer( 0, self.spawn_drone, args=("base",0, 0)).start()
+        self.spawn_drone("base", 0, 0)
         for i in range(self.nb_drones_surface):
             angle = (2 * math.pi / self.nb_drones_surface) * i
             vx = math.cos(angle)
             vy = math.sin(angle)
-            threading.Timer(0 * i, self.spawn_drone, args=("drone_de_surface", vx, vy)).start()
+            self.spawn_drone("drone_de_surface", vx, vy)
 
         offset = self.nb_drones_surface * 0.5
         for i in range(self.nb_drones_aerien):
             angle = (2 * math.pi / self.nb_drones_aerien) * i
             vx = math.cos(angle)
             vy = math.sin(angle)
-            threading.Timer(0 * i, self.spawn_drone, args=("drone_aerien", vx, vy)).start()
+            self.spawn_drone("drone_aerien", vx, vy)
 
     def handleClick(self, x, y):
         print("In handle click", x, " ", y)
@@ -251,16 +290,19 @@ class Simulation:
                     
                     self.start_cone = boat.start_cone
                     self.cone = boat.cone
+                    masque_cone = CarteZones.triangle(*boat.cone) # Rasterisé une fois pour tous les drones
                     boat.base.start_cone = boat.start_cone
                     boat.base.cone = boat.cone
-                    self.creatures.append(boat.base)
+                    boat.base.masque_cone = masque_cone
+                    self._rattacher_creature(boat.base)
 
                     # Drones
                     for _ in range(len(boat.drones)):
                         drone = boat.drones.pop()
                         drone.start_cone = boat.start_cone
                         drone.cone = boat.cone
-                        self.creatures.append(drone)
+                        drone.masque_cone = masque_cone
+                        self._rattacher_creature(drone)
                     self.homme_a_la_mer = boat.man_overboard
                     for boat_temp in self.boats:
                         if self.homme_a_la_mer:
@@ -268,20 +310,35 @@ class Simulation:
                             for i in range(len(boat_temp.drones)):
                                 drone = boat_temp.drones.pop()
                                 drone.cone = self.cone
+                                drone.masque_cone = masque_cone
                                 drone.start_cone = self.start_cone
                                 print("Drone START corrd: ", drone.start_cone)
                                 print("drone cone points: ", drone.cone)
-                                self.creatures.append(drone)
+                                self._rattacher_creature(drone)
                 else:
                     boat.create_man_overboard()
         return None
 
     def spawn_drone(self, drone_type, vx, vy):
         creature_id = self.get_next_creature_id()
-        self.creatures.append(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, vx, vy, drone_type, self.logger, creature_id))
+        self._rattacher_creature(Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, vx, vy, drone_type, self.logger, creature_id, self.horloge, self.rng))
+
+    def _rattacher_creature(self, creature):
+        """Ajoute une créature à la simulation et la branche sur l'horloge et la couverture partagées"""
+        creature.horloge = self.horloge
+        creature.rng = self.rng
+        creature.couverture_globale = self.zones_explorees
+        creature.compteur_connaissances = self.compteur_connaissances
+        self.compteur_connaissances += creature.zones_decouvertes_uniques.masque()
+        creature.grille_obstacles = self.grille_obstacles
+        self.zones_explorees.update(creature.zone_exploree)
+        self.creatures.append(creature)
+        creature.compteurs = self.compteurs_flotte
+        self.compteurs_flotte.ajouter(creature)
+        self.version_creatures += 1
 
     def spawn_boat(self):
-        self.boats.append(Boat(speed=3))
+        self.boats.append(Boat(speed=3, horloge=self.horloge, rng=self.rng))
 
     def generer_monde(self, mode):
 
@@ -289,23 +346,26 @@ class Simulation:
             self.spawn_all_drones()
         
             for i in range(15):
-                x = random.randint(0, constant.LARGEUR_SIMULATION - 100)
-                y = random.randint(0, constant.HAUTEUR_SIMULATION - 100)
-                constant.largeur = random.randint(20, 80)
-                hauteur = random.randint(20, 80)
+                x = self.rng_monde.randint(0, constant.LARGEUR_SIMULATION - 100)
+                y = self.rng_monde.randint(0, constant.HAUTEUR_SIMULATION - 100)
+                constant.largeur = self.rng_monde.randint(20, 80)
+                hauteur = self.rng_monde.randint(20, 80)
                 self.obstacles.append(Obstacle(x, y, constant.largeur, hauteur))
 
+        self.grille_obstacles.reconstruire(self.obstacles)
+
         surface_totale = constant.LARGEUR_SIMULATION * constant.HAUTEUR_SIMULATION
         surface_brouillage_cible = surface_totale * (self.pourcentage_brouillage / 100.0)
         surface_brouillage_actuelle = 0
         max_zones = 200 
         while surface_brouillage_actuelle < surface_brouillage_cible and len(self.brouillages) < max_zones:
-            constant.largeur = random.randint(40, 120)
-            hauteur = random.randint(40, 120)
-            x = random.randint(0, constant.LARGEUR_SIMULATION - constant.largeur)
-            y = random.randint(0, constant.HAUTEUR_SIMULATION - hauteur)
+            constant.largeur = self.rng_monde.randint(40, 120)
+            hauteur = self.rng_monde.randint(40, 120)
+            x = self.rng_monde.randint(0, constant.LARGEUR_SIMULATION - constant.largeur)
+            y = self.rng_monde.randint(0, constant.HAUTEUR_SIMULATION - hauteur)
             self.brouillages.append(Brouillage(x, y, constant.largeur, hauteur))
             surface_brouillage_actuelle += constant.largeur * hauteur
+        self.grille_brouillage.reconstruire(self.brouillages)
         if surface_totale > 0:
             self.pourcentage_brouillage_reel = (surface_brouillage_actuelle / surface_totale) * 100
         
@@ -315,31 +375,120 @@ class Simulation:
         homme_a_la_mer_x = 0
         homme_a_la_mer_y = 0
         while True:
-            homme_a_la_mer_x = random.randint(0, constant.LARGEUR_SIMULATION - 15)
-            homme_a_la_mer_y = random.randint(0, constant.HAUTEUR_SIMULATION - 15)
+            homme_a_la_mer_x = self.rng_monde.randint(0, constant.LARGEUR_SIMULATION - 15)
+            homme_a_la_mer_y = self.rng_monde.randint(0, constant.HAUTEUR_SIMULATION - 15)
             test_rect = pygame.Rect(homme_a_la_mer_x, homme_a_la_mer_y, 15, 15)
             
-            collision = False
-            for obstacle in self.obstacles:
-                if test_rect.colliderect(obstacle.rect):
-                    collision = True
-                    break
-            
-            if not collision:
+            if self.grille_obstacles.premier_en_collision(test_rect) is None:
                 break
         
         if (mode == "classic"):
             self.homme_a_la_mer = HommeALaMer(homme_a_la_mer_x, homme_a_la_mer_y)
+
+        self.hash_scenario = self.calculer_hash_scenario()
+        self.construire_calques()
         
         if self.logger and self.homme_a_la_mer:
             self.logger.log_event("world_generated", {
                 "obstacles": [[o.x, o.y, o.largeur, o.hauteur] for o in self.obstacles],
                 "brouillages": [[o.x, o.y, o.largeur, o.hauteur] for o in self.brouillages],
                 "homme_a_la_mer_position": [self.homme_a_la_mer.x, self.homme_a_la_mer.y],
-                "creatures_created": len(self.creatures)
+                "creatures_created": len(self.creatures),
+                "seed": self.seed,
+                "scenario_hash": self.hash_scenario
             })
-        
-        random.seed()
+
+    def construire_calques(self):
+        """
+        Calques de rendu réutilisés d'une frame à l'autre : la surface de la
+        simulation, le calque des zones explorées (complété au fil de
+        l'exploration) et le décor fixe (obstacles et brouillage).
+        """
+        taille = (constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION)
+        self.ecran_simulation = pygame.Surface(taille)
+        self.calque_zones = pygame.Surface(taille)
+        self.calque_zones.fill(constant.NOIR)
+        self.carte_chaleur = pygame.Surface((CarteZones.LARGEUR, CarteZones.HAUTEUR)) # Un pixel par cellule
+        self.etat_carte_chaleur = None
+        self.couleurs_carte_chaleur = np.zeros((CarteZones.HAUTEUR, CarteZones.LARGEUR, 3), dtype=np.uint8)
+        self.couleurs_carte_chaleur[:] = constant.NOIR
+        self.rafraichir_tout = True
+
+        # Zones de brouillage blittées une à une : leurs transparences se cumulent
+        # là où elles se recouvrent, comme sur l'écran. Puis obstacles opaques
+        # (mélangés au brouillage qui les recouvre, comme quand ils étaient dessinés avant lui)
+        calque_brouillage = pygame.Surface(taille, pygame.SRCALPHA)
+        for brouillage in self.brouillages:
+            calque_brouillage.blit(brouillage.rendre(), brouillage.rect.topleft)
+        self.calque_statique = calque_brouillage.copy()
+        for obstacle in self.obstacles:
+            surface_obstacle = pygame.Surface(obstacle.rect.size)
+            obstacle.dessiner(surface_obstacle, (0, 0))
+            surface_obstacle.blit(calque_brouillage, (0, 0), area=obstacle.rect)
+            self.calque_statique.blit(surface_obstacle, obstacle.rect.topleft)
+
+    def mettre_a_jour_calque_zones(self):
+        """
+        Carte de chaleur : chaque cellule explorée prend une teinte de bleu
+        selon la part des drones qui la connaissent (compteur tenu à jour par
+        les drones). Rendue un pixel par cellule via une table de couleurs puis
+        agrandie en un seul blit, et seulement quand le compteur a changé.
+        Renvoie les rectangles (tuiles de TAILLE_TUILE_RENDU cellules) dont
+        la couleur a changé.
+        """
+        total_drones = len(self.creatures)
+        etat = (total_drones, self.zones_explorees.bits, self.compteur_connaissances.tobytes())
+        if etat == self.etat_carte_chaleur:
+            return []
+        self.etat_carte_chaleur = etat
+
+        intensites = np.arange(total_drones + 1) / total_drones if total_drones > 0 else np.zeros(1)
+        intensites_effectives = (0.5 + 0.5 * intensites)[:, None]
+        table_couleurs = (np.array(constant.NOIR) * (1 - intensites_effectives) + np.array(constant.BLEU) * intensites_effectives).astype(np.uint8)
+
+        couleurs = table_couleurs[np.clip(self.compteur_connaissances, 0, total_drones)]
+        couleurs[self.zones_explorees.masque() == 0] = constant.NOIR
+        pygame.surfarray.blit_array(self.carte_chaleur, couleurs.transpose(1, 0, 2))
+        pygame.transform.scale(self.carte_chaleur, self.calque_zones.get_size(), self.calque_zones)
+
+        modifiees = (couleurs != self.couleurs_carte_chaleur).any(axis=2)
+        self.couleurs_carte_chaleur = couleurs
+        t = constant.TAILLE_TUILE_RENDU
+        hauteur_tuiles, largeur_tuiles = -(-CarteZones.HAUTEUR // t), -(-CarteZones.LARGEUR // t)
+        tuiles = np.zeros((hauteur_tuiles * t, largeur_tuiles * t), dtype=bool)
+        tuiles[:CarteZones.HAUTEUR, :CarteZones.LARGEUR] = modifiees
+        tuiles = tuiles.reshape(hauteur_tuiles, t, largeur_tuiles, t).any(axis=(1, 3))
+        cote = t * CarteZones.TAILLE_CELLULE
+        return [pygame.Rect(int(tx) * cote, int(ty) * cote, cote, cote) for ty, tx in zip(*np.nonzero(tuiles))]
+
+    def surface_cone(self):
+        """
+        Voile transparent du cône de recherche, recadré sur sa partie visible
+        et mis en cache tant que les sommets du cône ne changent pas.
+        """
+        cle = tuple(tuple(point) for point in self.cone)
+        if self.sprite_cone is None or self.sprite_cone[0] != cle:
+            xs = [point[0] for point in cle]
+            ys = [point[1] for point in cle]
+            englobant = pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+            visible = englobant.clip(pygame.Rect(0, 0, constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION))
+            surface = None
+            if visible.width and visible.height:
+                surface = pygame.Surface(visible.size, pygame.SRCALPHA)
+                pygame.draw.polygon(surface, (255, 255, 0, 60), [(x - visible.x, y - visible.y) for x, y in cle])
+            self.sprite_cone = (cle, surface, visible.topleft)
+        return self.sprite_cone[1], self.sprite_cone[2]
+
+    def calculer_hash_scenario(self):
+        """Empreinte SHA-256 stable du monde généré (obstacles, brouillage, homme à la mer, spawn)"""
+        contenu = {
+            "mode": self.mode,
+            "spawn": [self.spawn_x, self.spawn_y],
+            "obstacles": [[o.x, o.y, o.largeur, o.hauteur] for o in self.obstacles],
+            "brouillages": [[b.x, b.y, b.largeur, b.hauteur] for b in self.brouillages],
+            "homme_a_la_mer": [self.homme_a_la_mer.x, self.homme_a_la_mer.y] if self.homme_a_la_mer else None,
+        }
+        return hashlib.sha256(json.dumps(contenu, sort_keys=True).encode("utf-8")).hexdigest()
     
     def changer_spawn(self, x, y):
         old_spawn = [self.spawn_x, self.spawn_y]
@@ -355,11 +504,12 @@ class Simulation:
         for creature in self.creatures:
             creature.spawn_x = x
             creature.spawn_y = y
+        self.version_creatures += 1
     
     def ajouter_creature(self, type_creature):
         creature_id = self.get_next_creature_id()
-        nouvelle_creature = Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, type_creature, self.logger, creature_id)
-        self.creatures.append(nouvelle_creature)
+        nouvelle_creature = Drone(self.spawn_x, self.spawn_y, self.spawn_x, self.spawn_y, 0, 0, type_creature, self.logger, creature_id, self.horloge, self.rng)
+        self._rattacher_creature(nouvelle_creature)
         
         if type_creature == "drone_de_surface":
             self.nb_drones_surface += 1
@@ -372,6 +522,11 @@ class Simulation:
         for i, creature in enumerate(self.creatures):
             if creature.type_creature == type_creature:
                 self.creatures.pop(i)
+                self.compteurs_flotte.retirer(creature)
+                creature.compteurs = None
+                self.version_creatures += 1
+                self.compteur_connaissances -= creature.zones_decouvertes_uniques.masque()
+                creature.compteur_connaissances = None
                 if type_creature == "drone_de_surface":
                     self.nb_drones_surface -= 1
                 else:
@@ -379,9 +534,214 @@ class Simulation:
                 return True
         return False
     
-    def mettre_a_jour(self, ecran_simulation):
+    def paires_en_portee(self, actifs):
+        """
+        Paires (i, j), i < j, de créatures actives à portée de communication,
+        c'est-à-dire à une distance <= moyenne de leurs deux rayons. Une paire
+        dont les deux membres sont au repos n'échange rien. Les distances sont
+        calculées d'un bloc sur les paires candidates : cKDTree si scipy est
+        disponible, sinon la grille spatiale (cellules de la taille de la plus
+        grande portée possible).
+        """
+        x = np.array([c.x for c in actifs])
+        y = np.array([c.y for c in actifs])
+        rayon = np.array([c.rayon_communication for c in actifs], dtype=float)
+        repos = np.array([c.en_repos for c in actifs], dtype=bool)
+
+        # Aucune paire ne porte plus loin que la moyenne des deux plus grands rayons
+        portee_max = np.partition(rayon, -2)[-2:].mean()
+        if cKDTree is not None:
+            paires = cKDTree(np.column_stack((x, y))).query_pairs(r=portee_max, output_type="ndarray")
+            i, j = paires[:, 0], paires[:, 1]
+        else:
+            self.grille_spatiale.reconstruire(x, y, max(1.0, portee_max))
+            i, j = self.grille_spatiale.paires_candidates()
+        distance = np.hypot(x[i] - x[j], y[i] - y[j])
+
+        garde = (distance <= (rayon[i] + rayon[j]) / 2) & ~(repos[i] & repos[j])
+        i, j = i[garde], j[garde]
+        ordre = np.argsort(i.astype(np.int64) * len(actifs) + j)
+        return i[ordre], j[ordre]
+
+    def communiquer_flotte(self):
+        """
+        Phase de communication de toute la flotte, une fois par tick et avant
+        les déplacements. Chaque paire n'est traitée qu'une fois : les
+        compteurs sont mis à jour en bloc et le lien n'est stocké que d'un côté.
+        Comme lorsque chaque drone appelait, tentatives et échecs ne sont
+        comptés que pour les membres de la paire qui ne sont pas au repos.
+        """
+        for creature in self.creatures:
+            creature.link = []
+        actifs = [c for c in self.creatures if not c.epuise]
+        if len(actifs) < 2:
+            return
+
+        i, j = self.paires_en_portee(actifs)
+        brouille = np.array([c.dans_brouillage for c in actifs], dtype=bool)
+        echec = brouille[i] | brouille[j]
+
+        n = len(actifs)
+        repos = np.array([c.en_repos for c in actifs], dtype=bool)
+        appelle_i, appelle_j = ~repos[i], ~repos[j]
+        tentatives = np.bincount(i[appelle_i], minlength=n) + np.bincount(j[appelle_j], minlength=n)
+        echouees = np.bincount(i[appelle_i & echec], minlength=n) + np.bincount(j[appelle_j & echec], minlength=n)
+        reussies = np.bincount(i[~echec], minlength=n) + np.bincount(j[~echec], minlength=n)
+        for creature, nb_tentatives, nb_echouees, nb_reussies in zip(actifs, tentatives.tolist(), echouees.tolist(), reussies.tolist()):
+            creature.tentatives_communication += nb_tentatives
+            if nb_echouees:
+                creature.compter_echecs(nb_echouees)
+            creature.communications_envoyees += nb_reussies
+
+        codes_type = {"drone_de_surface": 0, "drone_aerien": 1}
+        type_creature = np.array([codes_type.get(c.type_creature, 2) for c in actifs])
+        ok_i, ok_j = i[~echec], j[~echec]
+        surface_surface = int(np.count_nonzero((type_creature[ok_i] == 0) & (type_creature[ok_j] == 0)))
+        aerien_aerien = int(np.count_nonzero((type_creature[ok_i] == 1) & (type_creature[ok_j] == 1)))
+        self.comms_surface_surface += surface_surface
+        self.comms_aerien_aerien += aerien_aerien
+        self.comms_surface_aerien += len(ok_i) - surface_surface - aerien_aerien
+
+        if self.logger and self.logger.is_enabled("communication_failed_brouillage"):
+            for a, b in zip(i[echec].tolist(), j[echec].tolist()):
+                self.logger.log_event("communication_failed_brouillage", {
+                    "creature_1": {"id": actifs[a].creature_id, "position": [actifs[a].x, actifs[a].y]},
+                    "creature_2": {"id": actifs[b].creature_id, "position": [actifs[b].x, actifs[b].y]},
+                    "reason": "brouillage"
+                })
 
-        self.zones_explorees = set()
+        maintenant = self.horloge.maintenant()
+        # Contacts et date du dernier échange : une mise à jour en bloc par drone
+        membres = np.concatenate((ok_i, ok_j))
+        partenaires = np.concatenate((ok_j, ok_i))
+        ordre = np.argsort(membres, kind="stable")
+        membres, partenaires = membres[ordre], partenaires[ordre]
+        identifiants = np.array([c.creature_id for c in actifs])
+        drones, debuts = np.unique(membres, return_index=True)
+        for a, ids in zip(drones.tolist(), np.split(identifiants[partenaires], debuts[1:])):
+            ids = ids.tolist()
+            actifs[a].communications_reçues.update(ids)
+            actifs[a].derniere_communication.update(dict.fromkeys(ids, maintenant))
+
+        # Lien stocké du côté du plus petit indice (ok_i est trié)
+        tableau_actifs = np.empty(n, dtype=object)
+        tableau_actifs[:] = actifs
+        drones, debuts = np.unique(ok_i, return_index=True)
+        for a, liens in zip(drones.tolist(), np.split(ok_j, debuts[1:])):
+            actifs[a].link = tableau_actifs[liens].tolist()
+
+        if self.logger is not None and self.logger.is_enabled("communication_established"):
+            for a, b in zip(ok_i.tolist(), ok_j.tolist()):
+                creature_1, creature_2 = actifs[a], actifs[b]
+                self.logger.log_event("communication_established", {
+                    "creature_1": {
+                        "id": creature_1.creature_id,
+                        "type": creature_1.type_creature,
+                        "position": [creature_1.x, creature_1.y]
+                    },
+                    "creature_2": {
+                        "id": creature_2.creature_id,
+                        "type": creature_2.type_creature,
+                        "position": [creature_2.x, creature_2.y]
+                    },
+                    "distance": round(math.hypot(creature_1.x - creature_2.x, creature_1.y - creature_2.y), 2),
+                    "communication_data": {
+                        "creature_1_contacts": len(creature_1.communications_reçues),
+                        "creature_2_contacts": len(creature_2.communications_reçues)
+                    }
+                })
+
+        self.partager_par_composantes(actifs, ok_i, ok_j)
+
+    @staticmethod
+    def composantes_connexes(n, i, j):
+        """
+        Étiquette de composante connexe de chaque sommet 0..n-1 du graphe
+        d'arêtes (i, j) : le plus petit sommet de la composante. Accrochage
+        au plus petit voisin puis compression des chemins, en NumPy.
+        """
+        etiquettes = np.arange(n)
+        while len(i) and (etiquettes[i] != etiquettes[j]).any():
+            minimum = np.minimum(etiquettes[i], etiquettes[j])
+            np.minimum.at(etiquettes, etiquettes[i], minimum)
+            np.minimum.at(etiquettes, etiquettes[j], minimum)
+            while True:
+                compressees = etiquettes[etiquettes]
+                if np.array_equal(compressees, etiquettes):
+                    break
+                etiquettes = compressees
+        return etiquettes
+
+    def partager_par_composantes(self, actifs, ok_i, ok_j):
+        """
+        Fusion des connaissances par groupe de drones reliés (composante
+        connexe des communications réussies) : les zones de tous les membres
+        sont réunies une fois, puis chaque membre reçoit ce qui lui manque. Le
+        partage est donc transitif dans le tick, comme une chaîne de relais.
+        Seuls les drones qui apprennent quelque chose passent par
+        connaitre_zones. La découverte de l'homme à la mer se propage aussi à
+        tout le groupe, depuis le membre qui l'a trouvé le premier.
+        """
+        if not len(ok_i):
+            return
+        etiquettes = self.composantes_connexes(len(actifs), ok_i, ok_j)
+        relies = np.zeros(len(actifs), dtype=bool)
+        relies[ok_i] = relies[ok_j] = True
+        indices = np.flatnonzero(relies)
+        ordre = np.argsort(etiquettes[indices], kind="stable")
+        indices = indices[ordre]
+        _, debuts = np.unique(etiquettes[indices], return_index=True)
+        for groupe in np.split(indices, debuts[1:]):
+            membres = [actifs[k] for k in groupe.tolist()]
+            union = 0
+            for membre in membres:
+                union |= membre.zone_exploree.bits
+            for membre in membres:
+                manquantes = union & ~membre.zone_exploree.bits
+                if manquantes:
+                    zones = CarteZones(manquantes)
+                    membre.zone_exploree.update(zones)
+                    membre.connaitre_zones(zones)
+
+            decouvreurs = [m for m in membres if m.a_trouve_homme_mer]
+            if decouvreurs and len(decouvreurs) < len(membres):
+                source = min(decouvreurs, key=lambda m: m.temps_premiere_decouverte_homme_mer if m.temps_premiere_decouverte_homme_mer is not None else float("inf"))
+                for membre in membres:
+                    if not membre.a_trouve_homme_mer:
+                        membre.a_trouve_homme_mer = True
+                        membre.homme_positions_connues = source.homme_positions_connues
+                        membre.temps_premiere_decouverte_homme_mer = source.temps_premiere_decouverte_homme_mer
+
+    def synchroniser_flotte(self):
+        """Moteur vectoriel : recopie tout l'état de FleetState dans les objets Drone"""
+        if self.flotte is not None:
+            self.flotte.synchroniser()
+
+    def _verifier_decouverte(self, creature, ecran_simulation):
+        """Propage la découverte de l'homme à la mer et termine la mission quand la base l'apprend"""
+        if creature.a_trouve_homme_mer and creature.type_creature != "base":
+            self.homme_a_la_mer.decouvert= True
+            self.homme_a_la_mer.dessiner(ecran_simulation)
+        if creature.a_trouve_homme_mer and creature.type_creature == "base":
+            self.base_coord = (creature.spawn_x, creature.spawn_y)
+            self.homme_coord = (creature.homme_positions_connues[0], creature.homme_positions_connues[1])
+            self.homme_a_la_mer_decouvert = True
+            self.homme_a_la_mer.decouvert = True
+            self.temps_decouverte = self.horloge.maintenant()
+            self.simulation_reussie = True
+            self.premiere_decouverte_homme_mer = creature.temps_premiere_decouverte_homme_mer
+            self.qui_a_trouve_homme_mer = f"{creature.type_creature}_{creature.creature_id}"
+            self.pause_automatique = True
+            if self.logger:
+                self.logger.log_event("simulation_completed", {
+                    "winner": self.qui_a_trouve_homme_mer,
+                    "winner_id": creature.creature_id,
+                    "time_to_discovery": creature.temps_premiere_decouverte_homme_mer - self.temps_debut,
+                    "homme_a_la_mer_position": [self.homme_a_la_mer.x, self.homme_a_la_mer.y],
+                    "winner_communications": len(creature.communications_reçues)
+                })
+
+    def mettre_a_jour(self, ecran_simulation):
 
         if self.mode == "boat":
             for boat in self.boats:
@@ -393,7 +753,7 @@ class Simulation:
 
         if not self.homme_a_la_mer_decouvert and all(c.epuise for c in self.creatures):
             if not self.pause_automatique:
-                self.temps_fin = time.time()
+                self.temps_fin = self.horloge.maintenant()
                 self.simulation_reussie = False
                 self.pause_automatique = True
                 self.logger.log_event("simulation_failed_exhaustion", {
@@ -402,32 +762,24 @@ class Simulation:
                 })
             return
             
+        self.horloge.avancer()
         for creature in self.creatures:
-            creature.deplacer(self.obstacles, self.homme_a_la_mer, self.creatures, self.brouillages, self)
-            if creature.a_trouve_homme_mer and creature.type_creature != "base":
-                self.homme_a_la_mer.decouvert= True
-                self.homme_a_la_mer.dessiner(ecran_simulation)
-            if creature.a_trouve_homme_mer and creature.type_creature == "base":
-                self.base_coord = (creature.spawn_x, creature.spawn_y)
-                self.homme_coord = (creature.homme_positions_connues[0], creature.homme_positions_connues[1])
-                self.homme_a_la_mer_decouvert = True
-                self.homme_a_la_mer.decouvert = True
-                self.temps_decouverte = pygame.time.get_ticks()
-                self.simulation_reussie = True
-                self.premiere_decouverte_homme_mer = creature.temps_premiere_decouverte_homme_mer
-                self.qui_a_trouve_homme_mer = f"{creature.type_creature}_{creature.creature_id}"
-                self.pause_automatique = True
-                if self.logger:
-                    self.logger.log_event("simulation_completed", {
-                        "winner": self.qui_a_trouve_homme_mer,
-                        "winner_id": creature.creature_id,
-                        "time_to_discovery": creature.temps_premiere_decouverte_homme_mer - self.temps_debut,
-                        "homme_a_la_mer_position": [self.homme_a_la_mer.x, self.homme_a_la_mer.y],
-                        "winner_communications": len(creature.communications_reçues)
-                    })
-        for creature in self.creatures:
-            self.zones_explorees.update(creature.zone_exploree)
-        
+            creature.dans_brouillage = self.grille_brouillage.contient_point(creature.x, creature.y)
+        self.communiquer_flotte()
+
+        if self.moteur == "vectoriel":
+            if self.flotte is None or self.flotte.version != self.version_creatures:
+                self.synchroniser_flotte() # La nouvelle flotte repart de l'état des objets
+                self.flotte = FleetState(self.creatures, self.rng_numpy)
+                self.flotte.version = self.version_creatures
+            self.flotte.avancer(self)
+            for creature in self.creatures:
+                self._verifier_decouverte(creature, ecran_simulation)
+        else:
+            for creature in self.creatures:
+                creature.deplacer(self.obstacles, self.homme_a_la_mer, self.creatures, self.brouillages, self)
+                self._verifier_decouverte(creature, ecran_simulation)
+
         if self.logger and self.logger.frame_count % 30 == 0:
             simulation_state = {
                 "homme_a_la_mer_decouvert": self.homme_a_la_mer_decouvert,
@@ -439,11 +791,20 @@ class Simulation:
             self.logger.log_frame(self.creatures, simulation_state)
     
     def dessiner(self, ecran, afficher_cercles_communication):
+        """
+        Dessine la frame et renvoie les rectangles de l'écran qui ont changé,
+        à passer à pygame.display.update : anciennes et nouvelles positions
+        des drones et de leurs liens, tuiles de la carte de chaleur modifiées
+        et panneau de statistiques (tout l'écran au premier rendu ou quand des
+        bateaux sont présents).
+        """
+        self.synchroniser_flotte()
         ecran.fill(constant.GRIS)
         pygame.draw.rect(ecran, constant.NOIR, (0, 0, constant.LARGEUR, constant.HAUTEUR_ENTETE))
-        ecran_simulation = pygame.Surface((constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION))
-        ecran_simulation.fill(constant.NOIR)
-
+        ecran_simulation = self.ecran_simulation
+        zones_modifiees = self.mettre_a_jour_calque_zones()
+        zones_sprites = []
+        ecran_simulation.blit(self.calque_zones, (0, 0))
 
         if self.cone and len(self.cone) >= 3:
             left_pt = self.cone[1]
@@ -454,49 +815,31 @@ class Simulation:
                             (int(left_pt[0]), int(left_pt[1])), 2)
             pygame.draw.line(ecran_simulation, (255, 255, 0), (int(self.start_cone[0]), int(self.start_cone[1])), (int(right_pt[0]), int(right_pt[1])), 2)
 
-            cone_surface = pygame.Surface((constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION), pygame.SRCALPHA)
-
-            pygame.draw.polygon(cone_surface, (255, 255, 0, 60), self.cone)
-            ecran_simulation.blit(cone_surface, (0, 0))
-
-        for zone in self.zones_explorees:
-            temp = sum(1 for creature in self.creatures if zone in creature.zones_decouvertes_uniques)
-            total_drones = len(self.creatures)
-            intensite = (temp / total_drones if total_drones > 0 else 0)
-            intensite_effective = 0.5 + 0.5 * intensite
-            r = int(constant.NOIR[0] * (1 - intensite_effective) + constant.BLEU[0] * intensite_effective)
-            g = int(constant.NOIR[1] * (1 - intensite_effective) + constant.BLEU[1] * intensite_effective)
-            b = int(constant.NOIR[2] * (1 - intensite_effective) + constant.BLEU[2] * intensite_effective)
-            couleur = (r, g, b)
-
-            x, y = zone[0] * 10, zone[1] * 10
-            pygame.draw.circle(
-                    ecran_simulation,
-                    couleur,
-                    (x, y),
-                    10,
-                    width=1
-                )
-
-        for obstacle in self.obstacles:
-            obstacle.dessiner(ecran_simulation)
+            cone_surface, position = self.surface_cone()
+            if cone_surface is not None:
+                ecran_simulation.blit(cone_surface, position)
 
-        for brouillage in self.brouillages:
-            brouillage.dessiner(ecran_simulation)
+        ecran_simulation.blit(self.calque_statique, (0, 0))
         
         if self.homme_a_la_mer:
             self.homme_a_la_mer.dessiner(ecran_simulation)
+            zones_sprites.append(pygame.Rect(int(self.homme_a_la_mer.x) - 18, int(self.homme_a_la_mer.y) - 18, 37, 37))
 
         for boat in self.boats:
             boat.display(ecran_simulation)
         
         for creature in self.creatures:
             creature.dessiner(ecran_simulation, afficher_cercles_communication, self.brouillages)
+            zones_sprites.append(creature.zone_dessin(afficher_cercles_communication))
+            if not creature.epuise:
+                for autre in creature.link:
+                    zones_sprites.append(self._zone_segment(creature.x, creature.y, autre.x, autre.y))
         
         if not self.simulation_reussie and all(c.epuise for c in self.creatures) and self.mode == "classic":
-            font = pygame.font.Font(None, 40)
-            text = font.render("SIMULATION ÉCHOUÉE (Tous les drones sont épuisés) !", True, constant.ROUGE)
-            ecran_simulation.blit(text, (constant.LARGEUR_SIMULATION // 2 - text.get_width() // 2, constant.HAUTEUR_SIMULATION // 2))
+            text = cache_rendu.texte("SIMULATION ÉCHOUÉE (Tous les drones sont épuisés) !", 40, constant.ROUGE)
+            position = (constant.LARGEUR_SIMULATION // 2 - text.get_width() // 2, constant.HAUTEUR_SIMULATION // 2)
+            ecran_simulation.blit(text, position)
+            zones_sprites.append(text.get_rect(topleft=position))
 
         if(self.base_coord and self.homme_coord):
             for creature in self.creatures:
@@ -508,56 +851,102 @@ class Simulation:
                         (self.homme_a_la_mer.x, self.homme_a_la_mer.y),
                         width=2
                     )
+                    zones_sprites.append(self._zone_segment(creature.spawn_x, creature.spawn_y, self.homme_a_la_mer.x, self.homme_a_la_mer.y))
         ecran.blit(ecran_simulation, (0, constant.HAUTEUR_ENTETE))
 
-        self.afficher_info(ecran)
+        zone_info = self.afficher_info(ecran)
+
+        zones_a_effacer = self.zones_sprites_precedentes
+        self.zones_sprites_precedentes = zones_sprites
+        if self.rafraichir_tout or self.boats:
+            self.rafraichir_tout = False
+            return [ecran.get_rect()]
+        zone_simulation = pygame.Rect(0, 0, constant.LARGEUR_SIMULATION, constant.HAUTEUR_SIMULATION)
+        rects = []
+        for rect in zones_modifiees + zones_a_effacer + zones_sprites:
+            rect = rect.clip(zone_simulation)
+            if rect.width and rect.height:
+                rects.append(rect.move(0, constant.HAUTEUR_ENTETE))
+        if zone_info is not None:
+            rects.append(zone_info)
+        return rects
+
+    @staticmethod
+    def _zone_segment(x0, y0, x1, y1, epaisseur=2):
+        """Rectangle englobant un segment tracé avec l'épaisseur donnée"""
+        gauche, haut = int(min(x0, x1)) - epaisseur, int(min(y0, y1)) - epaisseur
+        return pygame.Rect(gauche, haut, int(abs(x1 - x0)) + 2 * epaisseur + 2, int(abs(y1 - y0)) + 2 * epaisseur + 2)
     
     def afficher_info(self, ecran):
-        font_section = pygame.font.Font(None, 24)
-        font_info = pygame.font.Font(None, 20)
-        
-        y_stats = constant.HAUTEUR_ENTETE + 10
-        pygame.draw.rect(ecran, constant.NOIR, (constant.LARGEUR_SIMULATION + 5, y_stats, constant.LARGEUR_BARRE_LATERALE - 10, (constant.HAUTEUR-constant.HAUTEUR_ENTETE)//2 - 15), 0, 5)
-        pygame.draw.rect(ecran, constant.GRIS, (constant.LARGEUR_SIMULATION + 5, y_stats, constant.LARGEUR_BARRE_LATERALE - 10, (constant.HAUTEUR-constant.HAUTEUR_ENTETE)//2 - 15), 1, 5)
+        """
+        Panneau de statistiques de la barre latérale. Les valeurs viennent des
+        compteurs de la flotte ; le panneau est redessiné dans une surface
+        mise en cache au plus une fois par PERIODE_PANNEAU_INFO_MS, et seulement
+        si une ligne a changé. Renvoie le rectangle d'écran du panneau quand il
+        a été redessiné, None sinon.
+        """
+        maintenant = pygame.time.get_ticks()
+        if self.dernier_rendu_info is not None and maintenant - self.dernier_rendu_info < constant.PERIODE_PANNEAU_INFO_MS:
+            ecran.blit(self.surface_info, (constant.LARGEUR_SIMULATION, constant.HAUTEUR_ENTETE))
+            return None
+        self.dernier_rendu_info = maintenant
 
-        text_stats_titre = font_section.render("Statistiques", True, constant.GRIS)
-        ecran.blit(text_stats_titre, (constant.LARGEUR_SIMULATION + 15, y_stats + 5))
-        y_stats += 30
+        lignes = self.lignes_panneau_info()
+        modifie = lignes != self.lignes_info
+        if modifie:
+            self.lignes_info = lignes
+            self.dessiner_panneau_info(lignes)
+        ecran.blit(self.surface_info, (constant.LARGEUR_SIMULATION, constant.HAUTEUR_ENTETE))
+
+        if constant.en_pause:
+            constant.font = cache_rendu.police(72)
 
-        drones_surface_actifs = sum(1 for c in self.creatures if c.type_creature == "drone_de_surface" and not c.epuise)
-        drones_surface_epuises = sum(1 for c in self.creatures if c.type_creature == "drone_de_surface" and c.epuise)
-        drones_aerien_actifs = sum(1 for c in self.creatures if c.type_creature == "drone_aerien" and not c.epuise)
-        drones_aerien_epuises = sum(1 for c in self.creatures if c.type_creature == "drone_aerien" and c.epuise)
-        
-        text = font_info.render(f"Drones de Surface: {drones_surface_actifs} (épuisés: {drones_surface_epuises})", True, constant.ROUGE)
-        ecran.blit(text, (constant.LARGEUR_SIMULATION + 15, y_stats))
-        y_stats += 20
-        text = font_info.render(f"Drones Aériens: {drones_aerien_actifs} (épuisés: {drones_aerien_epuises})", True, constant.BLEU)
-        ecran.blit(text, (constant.LARGEUR_SIMULATION + 15, y_stats))
-        y_stats += 20
+        if not modifie:
+            return None
+        return self.surface_info.get_rect(topleft=(constant.LARGEUR_SIMULATION, constant.HAUTEUR_ENTETE))
+
+    def lignes_panneau_info(self):
+        """Lignes du panneau : (texte, taille de police, couleur, décalage vertical après la ligne)"""
+        compteurs = self.compteurs_flotte
+        drones_surface_actifs = compteurs.actifs("drone_de_surface")
+        drones_surface_epuises = compteurs.nombre("drone_de_surface", "epuise")
+        drones_aerien_actifs = compteurs.actifs("drone_aerien")
+        drones_aerien_epuises = compteurs.nombre("drone_aerien", "epuise")
         total_zones = (constant.LARGEUR_SIMULATION // 10) * (constant.HAUTEUR_SIMULATION // 10)
         pourcentage = (len(self.zones_explorees) / total_zones) * 100
-        text = font_info.render(f"Zones explorées: {pourcentage:.1f}%", True, constant.BLANC)
-        ecran.blit(text, (constant.LARGEUR_SIMULATION + 15, y_stats))
-        y_stats += 20
         communications_reussies = self.comms_surface_surface + self.comms_surface_aerien + self.comms_aerien_aerien
-        communications_echouees = sum(c.communications_echouees for c in self.creatures)
-        elapsed_time = (self.temps_fin or time.time()) - self.temps_debut
-        text = font_info.render(f"Communications réussies: {communications_reussies}", True, constant.VIOLET)
-        ecran.blit(text, (constant.LARGEUR_SIMULATION + 15, y_stats))
-        y_stats += 20
-        text = font_info.render(f"Communications échouées: {communications_echouees}", True, constant.VIOLET)
-        ecran.blit(text, (constant.LARGEUR_SIMULATION + 15, y_stats))
-        y_stats += 30
-        text = font_info.render(f"Durée depuis le début: {elapsed_time}", True, constant.VIOLET)
-        ecran.blit(text, (constant.LARGEUR_SIMULATION + 15, y_stats))
+        elapsed_time = (self.temps_fin if self.temps_fin is not None else self.horloge.maintenant()) - self.temps_debut
+
+        lignes = [
+            (f"Drones de Surface: {drones_surface_actifs} (épuisés: {drones_surface_epuises})", 20, constant.ROUGE, 20),
+            (f"Drones Aériens: {drones_aerien_actifs} (épuisés: {drones_aerien_epuises})", 20, constant.BLEU, 20),
+            (f"Zones explorées: {pourcentage:.1f}%", 20, constant.BLANC, 20),
+            (f"Communications réussies: {communications_reussies}", 20, constant.VIOLET, 20),
+            (f"Communications échouées: {compteurs.communications_echouees}", 20, constant.VIOLET, 30),
+            (f"Durée depuis le début: {elapsed_time}", 20, constant.VIOLET, 30),
+        ]
+        if self.homme_a_la_mer_decouvert:
+            lignes.append(("HOMME À LA MER DÉCOUVERT !", 20, constant.VERT, 20))
+        return lignes
+
+    def dessiner_panneau_info(self, lignes):
+        """Redessine la surface du panneau ; les textes viennent du cache, rendus seulement quand leur valeur change"""
+        hauteur_cadre = (constant.HAUTEUR - constant.HAUTEUR_ENTETE) // 2 - 15
+        if self.surface_info is None:
+            # Le texte peut déborder du cadre : la surface couvre toute la largeur de la barre latérale
+            self.surface_info = pygame.Surface((constant.LARGEUR_BARRE_LATERALE, 10 + hauteur_cadre))
+        surface = self.surface_info
+        surface.fill(constant.GRIS)
+
+        y_stats = 10
+        cadre = pygame.Rect(5, y_stats, constant.LARGEUR_BARRE_LATERALE - 10, hauteur_cadre)
+        pygame.draw.rect(surface, constant.NOIR, cadre, 0, 5)
+        pygame.draw.rect(surface, constant.GRIS, cadre, 1, 5)
+
+        surface.blit(cache_rendu.texte("Statistiques", 24, constant.GRIS), (15, y_stats + 5))
         y_stats += 30
+        for texte, taille, couleur, decalage in lignes:
+            surface.blit(cache_rendu.texte(texte, taille, couleur), (15, y_stats))
+            y_stats += decalage
 
-        if self.homme_a_la_mer_decouvert:
-            text = font_info.render("HOMME À LA MER DÉCOUVERT !", True, constant.VERT)
-            ecran.blit(text, (constant.LARGEUR_SIMULATION + 15, y_stats))
-            y_stats += 20
-        
-        if constant.en_pause:
-            constant.font = pygame.font.Font(None, 72)
 
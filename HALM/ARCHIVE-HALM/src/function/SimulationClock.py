@@ -0,0 +1,19 @@
+from utils import constant
+
+class SimulationClock:
+    def __init__(self, dt=None):
+        """
+        Horloge simulée partagée par la simulation et ses drones.
+        Elle avance d'un pas fixe dt (en secondes simulées) à chaque tick,
+        indépendamment de la vitesse d'exécution de la machine.
+        """
+        self.dt = dt if dt is not None else 1 / constant.FPS
+        self.ticks = 0
+
+    def avancer(self, nb_ticks=1):
+        """Fait avancer l'horloge de nb_ticks pas"""
+        self.ticks += nb_ticks
+
+    def maintenant(self):
+        """Temps simulé écoulé depuis la création de l'horloge, en secondes"""
+        return self.ticks * self.dt
@@ -6,8 +6,10 @@ import sys
 import time
 import json
 import os
+import signal
 from datetime import datetime
 from utils import constant
+from utils import cache_rendu
 from function.Logger  import Logger
 from function.Simulation import Simulation
 # Initialisation de Pygame
@@ -25,16 +27,34 @@ def main():
     spawn_y = constant.HAUTEUR_SIMULATION/2
     pourcentage_zone_brouillee = 10 
     mode = sys.argv[1] if len(sys.argv) > 1 else "classic"
+    moteur = sys.argv[2] if len(sys.argv) > 2 else "objets" # "vectoriel" pour avancer la flotte avec FleetState
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else None # Graine du scénario, pour rejouer une mission à l'identique
     
     logger = Logger()
-    simulation = Simulation(nb_drones_surface, nb_drones_aerien, spawn_x, spawn_y, logger, pourcentage_zone_brouillee, mode)
+    simulation = Simulation(nb_drones_surface, nb_drones_aerien, spawn_x, spawn_y, logger, pourcentage_zone_brouillee, mode, moteur=moteur, seed=seed)
     afficher_cercles_communication = True
+
+    # kill -USR1 <pid> vide la trace des drones sur stderr (utile sans fenêtre, SDL_VIDEODRIVER=dummy)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: logger.vider_trace())
+
+    # Pas de temps fixe : le temps réel écoulé, multiplié par la vitesse, alimente un
+    # accumulateur vidé par ticks de simulation ; l'affichage ne se fait qu'une fois
+    # par tour de boucle, les frames sont donc sautées plutôt que la simulation ralentie.
+    indice_vitesse = 0
+    accumulateur = 0.0
+    dernier_instant = time.perf_counter()
+    pause_affichee = constant.en_pause
+
+    def simulation_peut_avancer():
+        return mode == "boat" or (not constant.en_pause and not simulation.pause_automatique)
     
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                simulation.temps_fin = time.time()
+                simulation.temps_fin = simulation.horloge.maintenant()
                 logger.save_logs()
+                logger.fermer()
                 simulation.sauvegarder_statistiques()
                 pygame.quit()
                 sys.exit()
@@ -44,11 +64,13 @@ def main():
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
+                    logger.fermer()
                     logger = Logger()
-                    simulation = Simulation(nb_drones_surface, nb_drones_aerien, spawn_x, spawn_y, logger, pourcentage_zone_brouillee)
+                    simulation = Simulation(nb_drones_surface, nb_drones_aerien, spawn_x, spawn_y, logger, pourcentage_zone_brouillee, mode, moteur=moteur, seed=seed)
+                    accumulateur = 0.0
 
                 elif event.key == pygame.K_1:
-                    if simulation.nb_drones_surface < 30:
+                    if simulation.nb_drones_surface < constant.NB_DRONES_MAX:
                         nb_drones_surface += 1
                         nouvelle_creature = simulation.ajouter_creature("drone_de_surface")
                         
@@ -59,7 +81,7 @@ def main():
                             })
                 
                 elif event.key == pygame.K_2:
-                    if simulation.nb_drones_aerien < 30:
+                    if simulation.nb_drones_aerien < constant.NB_DRONES_MAX:
                         nb_drones_aerien += 1
                         nouvelle_creature = simulation.ajouter_creature("drone_aerien")
                         
@@ -99,7 +121,7 @@ def main():
                     afficher_cercles_communication = not afficher_cercles_communication
                 
                 elif event.key == pygame.K_s:
-                    simulation.temps_fin = time.time()
+                    simulation.temps_fin = simulation.horloge.maintenant()
                     fichier = simulation.sauvegarder_statistiques()
                     if fichier:
                         print(f"Statistiques sauvegardées: {fichier}")
@@ -109,19 +131,49 @@ def main():
                     if fichier_log:
                         print(f"Logs sauvegardés: {fichier_log}")
 
-        if not constant.en_pause and not simulation.pause_automatique:
-            simulation.mettre_a_jour(ecran)
-        elif mode == "boat":
-            simulation.mettre_a_jour(ecran)
+                elif event.key == pygame.K_t:
+                    print(f"Trace des drones {'activée' if logger.basculer_trace() else 'désactivée'}")
+
+                elif event.key == pygame.K_d:
+                    logger.vider_trace()
+
+                elif event.key == pygame.K_v:
+                    indice_vitesse = (indice_vitesse + 1) % len(constant.VITESSES_SIMULATION)
+                    accumulateur = 0.0
+                    vitesse = constant.VITESSES_SIMULATION[indice_vitesse]
+                    print(f"Vitesse de simulation: {'max' if vitesse is None else f'x{vitesse}'}")
+                    if logger:
+                        logger.log_event("speed_changed", {"speed": vitesse if vitesse is not None else "max"})
+
+        maintenant = time.perf_counter()
+        ecoule = maintenant - dernier_instant
+        dernier_instant = maintenant
+
+        vitesse = constant.VITESSES_SIMULATION[indice_vitesse]
+        if not simulation_peut_avancer():
+            accumulateur = 0.0
+        elif vitesse is None:
+            # Vitesse max : autant de ticks que possible pendant la durée d'une frame
+            limite = maintenant + 1 / constant.FPS
+            while simulation_peut_avancer() and time.perf_counter() < limite:
+                simulation.mettre_a_jour(ecran)
+        else:
+            accumulateur += min(ecoule, constant.RETARD_MAX_RATTRAPE) * vitesse
+            while accumulateur >= simulation.horloge.dt and simulation_peut_avancer():
+                simulation.mettre_a_jour(ecran)
+                accumulateur -= simulation.horloge.dt
         
-        simulation.dessiner(ecran, afficher_cercles_communication)
+        rects = simulation.dessiner(ecran, afficher_cercles_communication)
         
         if constant.en_pause:
-            font = pygame.font.Font(None, 72)
-            text = font.render("PAUSE", True, constant.ROUGE)
+            text = cache_rendu.texte("PAUSE", 72, constant.ROUGE)
             ecran.blit(text, (constant.LARGEUR_SIMULATION // 2 - 80, constant.HAUTEUR // 2 - 36))
-        
-        pygame.display.flip()
+
+        # Seuls les rectangles modifiés sont envoyés à l'affichage ; tout l'écran quand la pause change
+        if constant.en_pause != pause_affichee:
+            pause_affichee = constant.en_pause
+            rects = [ecran.get_rect()]
+        pygame.display.update(rects)
         horloge.tick(constant.FPS)
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+# Cache de rendu partagé : polices chargées une seule fois, textes et sprites
+# pré-rendus réutilisés d'une frame à l'autre. Les surfaces sont créées à la
+# première demande (pygame doit être initialisé).
+import pygame
+from utils import constant
+
+TAILLE_MAX_TEXTES = 2048 # Au-delà, le cache des textes est vidé (valeurs qui changent sans cesse)
+
+_polices = {}
+_textes = {}
+_anneaux = {}
+_impulsions = {}
+
+def police(taille):
+    """Police par défaut de pygame à la taille donnée"""
+    resultat = _polices.get(taille)
+    if resultat is None:
+        resultat = _polices[taille] = pygame.font.Font(None, taille)
+    return resultat
+
+def texte(contenu, taille, couleur):
+    """Surface du texte rendu (anticrénelé), mise en cache par (contenu, taille, couleur)"""
+    cle = (contenu, taille, couleur)
+    surface = _textes.get(cle)
+    if surface is None:
+        if len(_textes) >= TAILLE_MAX_TEXTES:
+            _textes.clear()
+        surface = _textes[cle] = police(taille).render(contenu, True, couleur)
+    return surface
+
+def etiquette_id(creature_id):
+    """Numéro affiché au-dessus d'un drone"""
+    return texte(str(creature_id), 16, constant.NOIR)
+
+def anneau_communication(rayon):
+    """Cercle fixe de portée de communication, centré dans un carré de côté 2 * rayon"""
+    sprite = _anneaux.get(rayon)
+    if sprite is None:
+        sprite = pygame.Surface((rayon * 2, rayon * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*constant.BLANC, 30), (rayon, rayon), rayon, width=2)
+        _anneaux[rayon] = sprite
+    return sprite
+
+def impulsion_radar(rayon):
+    """Onde du radar de communication, centrée dans un carré de côté 2 * rayon"""
+    sprite = _impulsions.get(rayon)
+    if sprite is None:
+        sprite = pygame.Surface((rayon * 2, rayon * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*constant.BLANC, 180), (rayon, rayon), rayon, width=2)
+        _impulsions[rayon] = sprite
+    return sprite
@@ -4,6 +4,12 @@ LARGEUR = 1200
 HAUTEUR = 900
 FPS = 60
 FACTEUR_ACCELERATION = 1
+NB_DRONES_MAX = 300
+TAILLE_CELLULE = 10 # Résolution de la grille d'exploration, en pixels
+VITESSES_SIMULATION = (1, 4, 16, None) # Multiplicateurs parcourus avec la touche V ; None = aussi vite que possible
+PERIODE_PANNEAU_INFO_MS = 200 # Le panneau de statistiques est redessiné à 5 Hz au plus
+TAILLE_TUILE_RENDU = 6 # Côté (en cellules) des tuiles rafraîchies quand la carte de chaleur change
+RETARD_MAX_RATTRAPE = 0.25 # Temps réel (s) rattrapé au plus par frame, pour ne pas s'emballer quand un tick coûte trop cher
 
 # Couleurs
 NOIR = (2, 2, 2)